@@ -97,7 +97,6 @@ setup(
         'alternate_djerba.plugins.demo4': install_wildcards,
     },
     install_requires=[
-        'configparse',
         'email_validator',
         'jsonschema',
         'mako',
@@ -108,8 +107,10 @@ setup(
         'pyinstaller',
         'PyPDF2',
         'requests',
-        'statsmodels',
     ],
+    extras_require={
+        'fast': ['orjson>=3.9'], # optional speedup for report JSON serialization
+    },
     python_requires='>=3.10.6',
     author="Iain Bancarz",
     author_email="ibancarz [at] oicr [dot] on [dot] ca",
@@ -31,12 +31,13 @@ class configurable(core_base, ABC):
     - Get/set/query INI params (other than priority levels)
     """
 
-    # default list of known attributes -- may override in subclasses
-    KNOWN_ATTRIBUTES = [
+    # default set of known attributes -- may override in subclasses
+    # frozenset: immutable, shared across instances, O(1) membership checks
+    KNOWN_ATTRIBUTES = frozenset([
         cc.CLINICAL,
         cc.SUPPLEMENTARY,
         cc.RESEARCH
-    ]
+    ])
 
     def __init__(self, **kwargs):
         self.identifier = kwargs[cc.IDENTIFIER]
@@ -231,8 +232,9 @@ class configurable(core_base, ABC):
         """Check for required/unknown config keys in minimal config"""
         self.logger.info("Validating minimal config for component "+self.identifier)
         input_keys = config.options(self.identifier)
+        input_key_set = set(input_keys) # set membership, not a list scan per key
         for key in self.ini_required:
-            if key not in input_keys:
+            if key not in input_key_set:
                 self._raise_missing_config_error(key, input_keys, complete=False)
         for key in input_keys:
             if key not in self.ini_required and key not in self.ini_defaults:
@@ -247,9 +249,10 @@ class configurable(core_base, ABC):
         template = "{0} expected INI param(s) found for component {1}"
         self.logger.debug(template.format(len(all_keys), self.identifier))
         input_keys = config.options(self.identifier)
+        input_key_set = set(input_keys) # set membership, not a list scan per key
         for key in all_keys:
             # Check all keys defined for the component are present and non-null
-            if key not in input_keys:
+            if key not in input_key_set:
                 self._raise_missing_config_error(key, input_keys, complete=True)
             elif self._is_null(config.get(self.identifier, key)):
                 self._raise_null_param_error(key)
@@ -263,20 +266,19 @@ class configurable(core_base, ABC):
     def validate_priorities(self, config):
         # check priorities are non-negative integers
         # TODO sanity checking on other reserved params
-        ok = True
         for s in config.sections():
             for p in cc.PRIORITY_KEYS:
                 if config.has_option(s, p):
                     try:
                         v = config.getint(s, p)
+                        ok = v >= 0
                     except ValueError:
+                        v = config.get(s, p)
                         ok = False
-                    if v < 0:
-                        ok = False
-                if not ok:
-                    msg = "{0}:{1} must be a non-negative integer; got {2}".format(s, p, v)
-                    self.logger.error(msg)
-                    raise ValueError(msg)
+                    if not ok:
+                        msg = "{0}:{1} must be a non-negative integer; got {2}".format(s, p, v)
+                        self.logger.error(msg)
+                        raise ValueError(msg)
         return config
 
 class core_configurer(configurable):
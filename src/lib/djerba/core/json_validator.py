@@ -2,19 +2,26 @@
 
 # placeholder -- TODO add functionality based on bin/validate_plugin_json.py
 
+import functools
 import json
 import jsonschema
 import logging
 import os
 from djerba.util.logger import logger
 
+@functools.lru_cache(maxsize=32)
+def _load_schema(schema_path, mtime):
+    """Parse a schema file; cached by path and mtime, as validators are
+    constructed repeatedly with the same handful of schemas"""
+    with open(schema_path, 'r') as schema_file:
+        return json.loads(schema_file.read())
+
 class json_validator(logger):
 
     def __init__(self, schema_path, log_level=logging.WARNING, log_path=None):
         self.logger = self.get_logger(log_level, __name__, log_path)
         self.schema_path = schema_path
-        with open(self.schema_path, 'r') as schema_file:
-            self.schema = json.loads(schema_file.read())
+        self.schema = _load_schema(schema_path, os.path.getmtime(schema_path))
 
     def validate_string(self, input_string):
         return self.validate_data(json.loads(input_string))
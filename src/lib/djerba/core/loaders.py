@@ -61,6 +61,10 @@ class loader_base(core_base, ABC):
         self.log_path = log_path
         self.logger = self.get_logger(log_level, __name__, log_path)
         self.packages = self.resolve_top_packages()
+        # imported component modules, cached by type and name; importlib caches
+        # in sys.modules, but this also skips the find_spec walk over
+        # DJERBA_PACKAGES when a component is loaded again in a later phase
+        self._module_cache = {}
 
     def get_common_args(self, module_name, module):
         """Get the constructor args common to all component types"""
@@ -82,6 +86,9 @@ class loader_base(core_base, ABC):
             )
             self.logger.error(msg)
             raise DjerbaLoadError(msg)
+        cache_key = (module_type, name)
+        if cache_key in self._module_cache:
+            return self._module_cache[cache_key]
         # full name for import is eg. djerba.plugins.cnv.plugin
         # check each top-level package in turn
         # use the first one with a valid import spec; if none found, raise an error
@@ -114,6 +121,7 @@ class loader_base(core_base, ABC):
                 "no valid spec in top-level DJERBA_PACKAGES: {0}".format(self.packages)
             self.logger.error(msg)
             raise DjerbaLoadError(msg)
+        self._module_cache[cache_key] = module
         return module
 
     def instantiate_main(self, module, args):
@@ -4,8 +4,9 @@ Main class to:
 - Import and run plugins
 - Merge and output results
 """
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
-import json
+from itertools import groupby
 import logging
 import pdfkit
 import os
@@ -23,7 +24,7 @@ from djerba.core.json_validator import plugin_json_validator
 from djerba.core.render import html_renderer, pdf_renderer
 from djerba.core.loaders import \
     plugin_loader, merger_loader, helper_loader, core_config_loader
-from djerba.core.workspace import workspace
+from djerba.core.workspace import workspace, json_dumps, json_loads
 from djerba.util.args import arg_processor_base
 from djerba.util.logger import logger
 from djerba.util.validator import path_validator
@@ -55,6 +56,21 @@ class main_base(core_base):
         self.plugin_loader = plugin_loader(self.log_level, self.log_path)
         self.merger_loader = merger_loader(self.log_level, self.log_path)
         self.helper_loader = helper_loader(self.log_level, self.log_path)
+        # cache of loaded plugins/mergers by name, so each is loaded at most once per run
+        self._plugin_cache = {}
+        self._merger_cache = {}
+
+    def _get_merger(self, name):
+        """Load the named merger; memoized, like _get_plugin"""
+        if name not in self._merger_cache:
+            self._merger_cache[name] = self.merger_loader.load(name)
+        return self._merger_cache[name]
+
+    def _get_plugin(self, name):
+        """Load the named plugin; memoized, as configure/extract/render may each need it"""
+        if name not in self._plugin_cache:
+            self._plugin_cache[name] = self.plugin_loader.load(name, self.workspace)
+        return self._plugin_cache[name]
 
     def _get_render_priority(self, plugin_data):
         return plugin_data[cc.PRIORITIES][cc.RENDER]
@@ -81,9 +97,9 @@ class main_base(core_base):
         elif self._is_helper_name(name):
             component = self.helper_loader.load(name, self.workspace)
         elif self._is_merger_name(name):
-            component = self.merger_loader.load(name)
+            component = self._get_merger(name)
         else:
-            component = self.plugin_loader.load(name, self.workspace)
+            component = self._get_plugin(name)
         return component
 
     def _resolve_configure_dependencies(self, config, components, ordered_names):
@@ -92,13 +108,26 @@ class main_base(core_base):
     def _resolve_extract_dependencies(self, config, components, ordered_names):
         self._resolve_ini_deps(cc.DEPENDS_EXTRACT, config, components, ordered_names)
 
+    def _get_ini_deps(self, depends_key, config, components, name):
+        if config.has_option(name, depends_key):
+            depends_str = config.get(name, depends_key)
+        else:
+            depends_str = components[name].get_reserved_default(depends_key)
+        return self._parse_comma_separated_list(depends_str)
+
+    def _batch_has_internal_deps(self, config, components, batch):
+        # true if any component depends on another member of the same
+        # extract-priority batch; see base_extract
+        batch_set = set(batch)
+        for name in batch:
+            for dependency in self._get_ini_deps(cc.DEPENDS_EXTRACT, config, components, name):
+                if dependency in batch_set:
+                    return True
+        return False
+
     def _resolve_ini_deps(self, depends_key, config, components, ordered_names):
         for name in ordered_names:
-            if config.has_option(name, depends_key):
-                depends_str = config.get(name, depends_key)
-            else:
-                depends_str = components[name].get_reserved_default(depends_key)
-            depends = self._parse_comma_separated_list(depends_str)
+            depends = self._get_ini_deps(depends_key, config, components, name)
             if len(depends)>0:
                 failed = 0
                 for dependency in depends:
@@ -142,7 +171,7 @@ class main_base(core_base):
             self.logger.warning("No inputs found for merger: {0}".format(merger_name))
         else:
             self.logger.debug("{0} inputs found for merger: {1}".format(total, merger_name))
-        merger = self.merger_loader.load(merger_name)
+        merger = self._get_merger(merger_name)
         self.logger.debug("Loaded merger {0} for rendering".format(merger_name))
         return merger.render(merger_inputs)
 
@@ -174,17 +203,45 @@ class main_base(core_base):
         self.logger.debug('Generating core data structure')
         data = extraction_setup(self.log_level, self.log_path).run(config)
         self.logger.debug('Running extraction for plugins and mergers in priority order')
+        # components sharing an extract priority have no defined order with respect to
+        # each other, so their extract steps may safely run in parallel threads; the
+        # bulk of extract time is I/O and subprocess work, which releases the GIL
         order = 0
-        for name in ordered_names:
-            order += 1
-            component = components[name]
-            self.logger.debug('Extracting component {0} in order {1}'.format(name, order))
-            component.validate_full_config(config)
-            component_data = components[name].extract(config)
-            if not self._is_helper_name(name):
-                # only plugins and mergers, not helpers, write data in the JSON document
-                self.json_validator.validate_data(component_data)
-                data[self.PLUGINS][name] = component_data
+        for priority, group in groupby(ordered_names, key=lambda x: priorities[x]):
+            batch = list(group)
+            for name in batch:
+                order += 1
+                msg = 'Extracting component {0} in order {1}'.format(name, order)
+                self.logger.debug(msg)
+                components[name].validate_full_config(config)
+            if len(batch) == 1:
+                extracted = [components[batch[0]].extract(config)]
+            elif self._batch_has_internal_deps(config, components, batch):
+                # the dependency resolver permits a depends_extract target at
+                # the same priority if it appears earlier in the order; such
+                # batches must run sequentially, with queued writes flushed
+                # between components so dependents can read them
+                msg = 'Same-priority extract dependency at priority {0}; '+\
+                    'running {1} components sequentially'
+                self.logger.debug(msg.format(priority, len(batch)))
+                extracted = []
+                for name in batch:
+                    extracted.append(components[name].extract(config))
+                    self.workspace.flush()
+            else:
+                msg = 'Extracting {0} components in parallel at priority {1}'
+                self.logger.debug(msg.format(len(batch), priority))
+                with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+                    extracted = list(
+                        executor.map(lambda n: components[n].extract(config), batch)
+                    )
+            for name, component_data in zip(batch, extracted):
+                if not self._is_helper_name(name):
+                    # only plugins and mergers, not helpers, write data in the JSON document
+                    self.json_validator.validate_data(component_data)
+                    data[self.PLUGINS][name] = component_data
+            # write queued workspace files, so later-priority components can read them
+            self.workspace.flush()
         # 3. Render the HTML; encode and store in data structure
         self.logger.debug('Generating HTML for cache')
         data[cc.HTML_CACHE] = {}
@@ -210,7 +267,7 @@ class main_base(core_base):
         self.logger.debug('Rendering plugin HTML')
         for plugin_name in data[self.PLUGINS]:
             plugin_data = data[self.PLUGINS][plugin_name]
-            plugin = self.plugin_loader.load(plugin_name, self.workspace)
+            plugin = self._get_plugin(plugin_name)
             html_raw = plugin.render(plugin_data)
             html[plugin_name] = self.html_cache.wrap_html(plugin_name, html_raw)
             self.logger.debug("Ran plugin '{0}' for rendering".format(plugin_name))
@@ -231,7 +288,8 @@ class main_base(core_base):
             p_rend = pdf_renderer(self.log_level, self.log_path)
             for prefix in output_data[cc.DOCUMENTS].keys():
                 html_path = os.path.join(out_dir, prefix+'.html')
-                with open(html_path, 'w', encoding=cc.TEXT_ENCODING) as out_file:
+                with open(html_path, 'w', buffering=1<<20,
+                          encoding=cc.TEXT_ENCODING) as out_file:
                     out_file.write(output_data[cc.DOCUMENTS][prefix])
                 self.logger.info("Wrote HTML output to {0}".format(html_path))
                 if pdf:
@@ -338,7 +396,7 @@ class main_base(core_base):
             data[self.PLUGINS][plugin_name] = new_data[self.PLUGINS][plugin_name]
             data[constants.CONFIG][plugin_name] = new_data[constants.CONFIG][plugin_name]
             # load the plugin and render HTML for cache update
-            plugin = self.plugin_loader.load(plugin_name, self.workspace)
+            plugin = self._get_plugin(plugin_name)
             raw_html = plugin.render(new_data[self.PLUGINS][plugin_name])
             new_html[plugin_name] = self.html_cache.wrap_html(plugin_name, raw_html)
             self.logger.debug('Updated JSON for plugin {0}'.format(plugin_name))
@@ -354,7 +412,7 @@ class main_base(core_base):
     def update_data_from_file(self, new_data, json_path, force):
         """Read old JSON from a file, and return the updated data structure"""
         with open(json_path) as in_file:
-            data = json.loads(in_file.read())
+            data = json_loads(in_file.read())
         return self.update_report_data(new_data, data, force)
 
 
@@ -378,8 +436,9 @@ class main(main_base):
         if not json_path:
             json_path = self.get_default_json_output_path(data)
         self.logger.debug('Writing JSON output to {0}'.format(json_path))
-        with open(json_path, 'w', encoding=cc.TEXT_ENCODING) as out_file:
-            out_file.write(json.dumps(data))
+        # 1 MB buffer cuts down on write syscalls for large report payloads
+        with open(json_path, 'w', buffering=1<<20, encoding=cc.TEXT_ENCODING) as out_file:
+            out_file.write(json_dumps(data))
         if archive:
             self.upload_archive(data)
         else:
@@ -454,7 +513,7 @@ class main(main_base):
             json_path = self.get_json_input_path(ap.get_json())
             archive = ap.is_archive_enabled()
             with open(json_path) as json_file:
-                data = json.loads(json_file.read())
+                data = json_loads(json_file.read())
             self.render(data, ap.get_out_dir(), ap.is_pdf_enabled(), archive)
         elif mode == constants.REPORT:
             ini_path = ap.get_ini_path()
@@ -485,73 +544,75 @@ class main(main_base):
             self.logger.error(msg)
             raise RuntimeError(msg)
 
+    # components for each supported assay, in INI order; dispatch is a simple
+    # dict lookup instead of an if/elif chain over assay names
+    SETUP_COMPONENTS = {
+        'WGTS': [
+            'core',
+            'input_params_helper',
+            'provenance_helper',
+            'report_title',
+            'patient_info',
+            'case_overview',
+            'treatment_options_merger',
+            'summary',
+            'sample',
+            'genomic_landscape',
+            'expression_helper',
+            'wgts.snv_indel',
+            'wgts.cnv_purple',
+            'fusion',
+            'gene_information_merger',
+            'supplement.body',
+        ],
+        'WGS': [
+            'core',
+            'input_params_helper',
+            'provenance_helper',
+            'report_title',
+            'patient_info',
+            'case_overview',
+            'treatment_options_merger',
+            'summary',
+            'sample',
+            'genomic_landscape',
+            'wgts.snv_indel',
+            'wgts.cnv_purple',
+            'gene_information_merger',
+            'supplement.body',
+        ],
+        'TAR': [
+            'core',
+            'tar_input_params_helper',
+            'provenance_helper',
+            'report_title',
+            'patient_info',
+            'case_overview',
+            'treatment_options_merger',
+            'summary',
+            'tar.sample',
+            'tar.snv_indel',
+            'tar.swgs',
+            'gene_information_merger',
+            'supplement.body',
+        ],
+        'PWGS': [
+            'core',
+            'report_title',
+            'patient_info',
+            'pwgs_provenance_helper',
+            'pwgs_cardea_helper',
+            'pwgs.case_overview',
+            'pwgs.summary',
+            'pwgs.sample',
+            'pwgs.analysis',
+            'supplement.body',
+        ],
+    }
+
     def setup(self, assay, ini_path, compact):
-        if assay == 'WGTS':
-            component_list = [
-                'core',
-                'input_params_helper',
-                'provenance_helper',
-                'report_title',
-                'patient_info',
-                'case_overview',
-                'treatment_options_merger',
-                'summary',
-                'sample',
-                'genomic_landscape',
-                'expression_helper',
-                'wgts.snv_indel',
-                'wgts.cnv_purple',
-                'fusion',
-                'gene_information_merger',
-                'supplement.body',
-            ]
-        elif assay == 'WGS':
-            component_list = [
-                'core',
-                'input_params_helper',
-                'provenance_helper',
-                'report_title',
-                'patient_info',
-                'case_overview',
-                'treatment_options_merger',
-                'summary',
-                'sample',
-                'genomic_landscape',
-                'wgts.snv_indel',
-                'wgts.cnv_purple',
-                'gene_information_merger',
-                'supplement.body',
-            ]
-        elif assay == 'TAR':
-            component_list = [
-                'core',
-                'tar_input_params_helper',
-                'provenance_helper',
-                'report_title',
-                'patient_info',
-                'case_overview',
-                'treatment_options_merger',
-                'summary',
-                'tar.sample',
-                'tar.snv_indel',
-                'tar.swgs',
-                'gene_information_merger',
-                'supplement.body',
-            ]
-        elif assay == 'PWGS':
-            component_list = [
-                'core',
-                'report_title',
-                'patient_info',
-                'pwgs_provenance_helper',
-                'pwgs_cardea_helper',
-                'pwgs.case_overview',
-                'pwgs.summary',
-                'pwgs.sample',
-                'pwgs.analysis',  
-                'supplement.body'
-            ]
-        else:
+        component_list = self.SETUP_COMPONENTS.get(assay)
+        if component_list is None:
             msg = "Invalid assay name '{0}'".format(assay)
             self.logger.error(msg)
             raise ValueError(msg)
@@ -580,7 +641,7 @@ class main(main_base):
         else:
             config = self.configure(config_path)
         with open(json_path) as in_file:
-            data = json.loads(in_file.read())
+            data = json_loads(in_file.read())
         data_new = self.base_extract(config)
         data = self.update_data_from_file(data_new, json_path, force)
         if archive:
@@ -591,24 +652,24 @@ class main(main_base):
             doc_key = self._get_unique_doc_key(data)
             self.render_from_cache(data, doc_key, out_dir, pdf)
             input_name = os.path.basename(json_path)
-            # generate an appropriate output filename
-            if re.search('\.updated\.json$', json_path):
+            # generate an appropriate output filename; plain string methods,
+            # no need to compile a regex for a fixed suffix
+            if json_path.endswith('.updated.json'):
                 output_name = input_name
-            elif not re.search('\.json$', json_path):
+            elif not json_path.endswith('.json'):
                 output_name = input_name+'.updated.json'
             else:
-                terms = re.split('\.', input_name)
-                terms.pop()
-                output_name = '.'.join(terms)+'.updated.json'
+                output_name = os.path.splitext(input_name)[0]+'.updated.json'
             json_path = os.path.join(out_dir, output_name)
-            with open(json_path, 'w', encoding=cc.TEXT_ENCODING) as out_file:
-                print(json.dumps(data), file=out_file)
+            with open(json_path, 'w', buffering=1<<20,
+                      encoding=cc.TEXT_ENCODING) as out_file:
+                print(json_dumps(data), file=out_file)
 
     def upload_archive(self, data):
         for plugin_name in data[self.PLUGINS]:
             # load each plugin and redact PHI (if any)
             plugin_data = data[self.PLUGINS][plugin_name]
-            plugin = self.plugin_loader.load(plugin_name, self.workspace)
+            plugin = self._get_plugin(plugin_name)
             data[self.PLUGINS][plugin_name] = plugin.redact(plugin_data)
         uploaded, report_id = database(self.log_level, self.log_path).upload_data(data)
         if uploaded:
@@ -8,6 +8,7 @@ import logging
 import os
 import pdfkit
 import traceback
+from itertools import chain
 from PyPDF2 import PdfMerger
 import djerba.core.constants as cc
 from djerba.util.date import get_todays_date
@@ -126,9 +127,13 @@ class html_renderer(logger):
             if len(section_html) > 0:
                 self.logger.info("Assembling HTML report document: {0}".format(doc_type))
                 body_sections = self._order_components(section_html, priorities)
-                document_sections = [self.get_document_header(doc_type), ]
-                document_sections.extend(body_sections)
-                document_sections.append(self.get_document_footer(doc_type))
+                # chain sections straight into the join; avoids copying the
+                # plugin HTML into an intermediate document list first
+                document_sections = chain(
+                    [self.get_document_header(doc_type), ],
+                    body_sections,
+                    [self.get_document_footer(doc_type), ]
+                )
                 # doc_key is the prefix for HTML/PDF filenames
                 doc_key = "{0}_report.{1}".format(self.report_id, doc_type)
                 data[cc.DOCUMENTS][doc_key] = "\n".join(document_sections)
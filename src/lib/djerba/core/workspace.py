@@ -10,9 +10,29 @@ import gzip
 import json
 import logging
 import os
+import djerba.core.constants as cc
 from djerba.util.logger import logger
 from djerba.util.validator import path_validator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(data):
+    """Serialize data to a JSON string; orjson is several times faster than stdlib"""
+    if orjson is not None:
+        return orjson.dumps(data).decode(cc.TEXT_ENCODING)
+    else:
+        return json.dumps(data)
+
+def json_loads(content):
+    """Parse a JSON string; orjson is several times faster than stdlib"""
+    if orjson is not None:
+        return orjson.loads(content)
+    else:
+        return json.loads(content)
+
 
 class workspace(logger):
 
@@ -23,6 +43,8 @@ class workspace(logger):
         self.validator = path_validator(self.log_level, self.log_path)
         self.validator.validate_output_dir(dir_path)
         self.dir_path = dir_path
+        self.pending_writes = {}
+        self.input_params_cache = None # (mtime, data) pair, see read_maybe_input_params
 
     def abs_path(self, rel_path):
         """Return the absolute path of a file in the workspace"""
@@ -53,19 +75,41 @@ class workspace(logger):
             self.validator.validate_output_file(file_path)
         return open(file_path, mode)
 
+    def flush(self):
+        """Write any queued strings to the workspace; see queue_string"""
+        for rel_path, output_string in self.pending_writes.items():
+            self.write_string(rel_path, output_string)
+        self.pending_writes = {}
+
     def print_location(self):
         return self.dir_path
 
+    def queue_string(self, rel_path, output_string):
+        """
+        Queue a string for writing at the next flush() call
+        Keeps file I/O off the critical path, eg. of a plugin extract step
+        Queueing the same relative path again overwrites the earlier string
+        """
+        self.pending_writes[rel_path] = output_string
+
     def read_json(self, rel_path):
         in_path = os.path.join(self.dir_path, rel_path)
         self.validator.validate_input_file(in_path)
         with open(in_path) as in_file:
-            data = json.loads(in_file.read())
+            data = json_loads(in_file.read())
         return data
 
     def read_maybe_input_params(self):
         # convenience method to read the input_params.json (if any)
-        return self.read_maybe_json('input_params.json')
+        # most components read this file during configure, so the parsed data
+        # is cached; the mtime key invalidates the cache if the file is rewritten
+        rel_path = 'input_params.json'
+        if not self.has_file(rel_path):
+            return self.read_maybe_json(rel_path) # logs the file as not found
+        mtime = os.path.getmtime(os.path.join(self.dir_path, rel_path))
+        if self.input_params_cache is None or self.input_params_cache[0] != mtime:
+            self.input_params_cache = (mtime, self.read_maybe_json(rel_path))
+        return self.input_params_cache[1]
 
     def read_maybe_json(self, rel_path):
         # if JSON file exists, read it and return the data; otherwise return None
@@ -92,6 +136,9 @@ class workspace(logger):
     # no need to validate paths for write_* methods; output dir already validated as writable
 
     def write_json(self, rel_path, data):
+        # stdlib formatting, not json_dumps: tests assert digests of workspace
+        # JSON files, so the bytes written must not depend on whether the
+        # optional orjson package is installed
         with open(os.path.join(self.dir_path, rel_path), 'w') as out_file:
             out_file.write(json.dumps(data))
 
@@ -4,6 +4,7 @@ import csv
 import gzip
 import logging
 import os
+import pandas
 import djerba.util.constants as constants
 import djerba.util.ini_fields as ini
 import djerba.core.constants as core_constants
@@ -102,7 +103,7 @@ class main(helper_base):
         """
         # read the gene id and FPKM metric from the GEP file for this report
         fkpm = {}
-        with open(gep_path) as gep_file:
+        with open(gep_path, newline='', buffering=1048576) as gep_file:
             reader = csv.reader(gep_file, delimiter="\t")
             for row in reader:
                 try:
@@ -116,7 +117,7 @@ class main(helper_base):
         ref_path = gep_reference
         out_file_name = 'gep.txt'
         with \
-             gzip.open(ref_path, 'rt', encoding=constants.TEXT_ENCODING) as in_file, \
+             gzip.open(ref_path, 'rt', encoding=constants.TEXT_ENCODING, newline='') as in_file, \
              self.workspace.open_file(out_file_name, 'wt') as out_file:
             # preprocess the GEP file
             reader = csv.reader(in_file, delimiter="\t")
@@ -155,18 +156,21 @@ class main(helper_base):
 
     def write_tcga_json(self):
         """Write TCGA expression percentiles in JSON format, for use by other plugins"""
-        expr = {}
-        with self.workspace.open_file(self.TCGA_EXPR_PCT_TEXT) as input_file:
-            for row in csv.reader(input_file, delimiter="\t"):
-                if row[0]=='Hugo_Symbol':
-                    continue
-                gene = row[0]
-                try:
-                    metric = float(row[1])
-                except ValueError as err:
-                    msg = 'Cannot convert expression value "{0}" to float, '.format(row[1])+\
-                          '; using 0 as fallback value: {0}'.format(err)
-                    self.logger.warning(msg)
-                    metric = 0.0
-                expr[gene] = metric
+        # vectorized pandas read; much faster than per-row float() for ~20k genes
+        df = pandas.read_csv(
+            self.workspace.abs_path(self.TCGA_EXPR_PCT_TEXT),
+            delimiter="\t",
+            header=None,
+            skiprows=1, # skip the Hugo_Symbol header row
+            names=['gene', 'metric'],
+            dtype={'gene': str}
+        )
+        metrics = pandas.to_numeric(df['metric'], errors='coerce')
+        bad = metrics.isna()
+        if bad.any():
+            msg = 'Cannot convert expression value(s) "{0}" to float'.format(
+                df['metric'][bad].tolist())+'; using 0 as fallback value'
+            self.logger.warning(msg)
+            metrics = metrics.fillna(0.0)
+        expr = dict(zip(df['gene'], metrics.tolist()))
         self.workspace.write_json(self.TCGA_EXPR_PCT_JSON, expr)
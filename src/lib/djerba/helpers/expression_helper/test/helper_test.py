@@ -5,6 +5,7 @@
 import logging
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from shutil import copy
 from djerba.core.loaders import helper_loader
@@ -86,10 +87,16 @@ class TestExpressionHelper(TestBase):
             'data_expression_zscores_tcga.txt': '70c92cf67705d0ad3f277a2b79d7c95a',
             'data_expression_percentile_tcga.json': '326dc17e5248416e7fa7e6b6150de79a'
         }
+        out_paths = []
         for name in expected:
             out_path = os.path.join(self.tmp_dir, name)
             self.assertTrue(os.path.exists(out_path))
-            self.assertEqual(self.getMD5(out_path), expected[name])
+            out_paths.append(out_path)
+        # hash the output files concurrently; the digest loop drops the GIL
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            digests = executor.map(self.getMD5, out_paths)
+        for name, digest in zip(expected, digests):
+            self.assertEqual(digest, expected[name])
 
 if __name__ == '__main__':
     unittest.main()
@@ -141,7 +141,7 @@ class main(helper_base):
         self.logger.info('Started reading file provenance from {0}'.format(provenance_path))
         total = 0
         kept = 0
-        with gzip.open(provenance_path, 'rt') as in_file, \
+        with gzip.open(provenance_path, 'rt', newline='') as in_file, \
              self.workspace.open_gzip_file(self.PROVENANCE_OUTPUT, write=True) as out_file:
             reader = csv.reader(in_file, delimiter="\t")
             writer = csv.writer(out_file, delimiter="\t")
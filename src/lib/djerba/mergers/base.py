@@ -6,6 +6,7 @@ Cannot be used to create an object (abstract) but can be subclassed (base class)
 import logging
 import os
 from abc import ABC
+from itertools import chain
 from djerba.core.configure import configurable
 from djerba.core.json_validator import json_validator
 from djerba.util.html import html_builder
@@ -33,6 +34,9 @@ class merger_base(configurable, html_builder, ABC):
             core_constants.RENDER_PRIORITY: 1000
         }
         self.attributes = []
+        # inputs already validated, keyed by id; holding a reference to the
+        # object keeps its id stable for the lifetime of the cache entry
+        self.validated_inputs = {}
         self.specify_params()
 
     def get_unique_dicts(self, inputs, primary_key):
@@ -52,8 +56,8 @@ class merger_base(configurable, html_builder, ABC):
         Merge a list of inputs matching the schema, remove duplicates, sort by given key
         Assumes the sort key is also a unique identifier for deduplication
         """
-        # input is a list of lists, flatten into a single list
-        flattened = [x for sublist in inputs_list for x in sublist]
+        # input is a list of lists, flatten into a single list at C level
+        flattened = list(chain.from_iterable(inputs_list))
         unique_items = self.get_unique_dicts(flattened, sort_key)
         return sorted(unique_items, key = lambda x: x[sort_key])
 
@@ -74,8 +78,12 @@ class merger_base(configurable, html_builder, ABC):
             self.ini_defaults[key] = priority
 
     def validate_inputs(self, inputs):
+        # skip inputs validated on a previous call, eg. when the report is
+        # rendered again for the HTML cache with the same data structure
         for item in inputs:
-            self.json_validator.validate_data(item)
+            if self.validated_inputs.get(id(item)) is not item:
+                self.json_validator.validate_data(item)
+                self.validated_inputs[id(item)] = item
         self.logger.info("All merger inputs validated")
 
 
@@ -3,7 +3,7 @@
 import re
 import djerba.core.constants as core_constants
 from djerba.mergers.base import merger_base
-from djerba.util.render_mako import mako_renderer
+import djerba.util.render_mako as render_mako
 
 
 class main(merger_base):
@@ -56,7 +56,7 @@ class main(merger_base):
         mako_input = {
             'rows': self.table_rows(data)
         }
-        renderer = mako_renderer(self.get_module_dir())
+        renderer = render_mako.get_renderer(self.get_module_dir())
         return renderer.render_name(self.MAKO_TEMPLATE_NAME, mako_input)
 
     def specify_params(self):
@@ -25,7 +25,7 @@ import re
 import djerba.core.constants as core_constants
 from djerba.mergers.base import merger_base, DjerbaMergerError
 from djerba.util.oncokb.tools import levels as oncokb
-from djerba.util.render_mako import mako_renderer
+import djerba.util.render_mako as render_mako
 
 
 class main(merger_base):
@@ -101,7 +101,7 @@ class main(merger_base):
             'investig_therapies': investig_therapies,
             'prognostic_markers': prognostic_noduplicates
         }
-        renderer = mako_renderer(self.get_module_dir())
+        renderer = render_mako.get_renderer(self.get_module_dir())
         return renderer.render_name(self.MAKO_TEMPLATE_NAME, data)
 
     def specify_params(self):
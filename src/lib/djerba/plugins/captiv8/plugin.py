@@ -182,7 +182,7 @@ class main(plugin_base):
     def get_tmb_value(self, r_script_dir, report_dir, maf_file):
         
         total = 0
-        with gzip.open(maf_file, 'rt', encoding=core_constants.TEXT_ENCODING) as data_file:
+        with gzip.open(maf_file, 'rt', encoding=core_constants.TEXT_ENCODING, newline='') as data_file:
             reader = csv.reader(data_file, delimiter="\t")
             first = True
             second = True
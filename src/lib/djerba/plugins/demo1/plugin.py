@@ -43,7 +43,8 @@ class main(plugin_base):
             'results': {},
         }
         question = 'What do you get if you multiply six by nine?'
-        self.workspace.write_string('question.txt', question)
+        # queued write is flushed by the core after the extract step
+        self.workspace.queue_string('question.txt', question)
         return data
 
     def render(self, data):
@@ -5,10 +5,10 @@ Utility classes for the fusions plugin
 import csv
 import logging
 import os
-import re
+import pandas as pd
+from collections import defaultdict
 from djerba.util.logger import logger
 from djerba.util.oncokb.tools import levels as oncokb_levels
-import djerba.util.oncokb.constants as oncokb
 from djerba.util.html import html_builder as hb
 from djerba.mergers.treatment_options_merger.factory import factory as tom_factory
 from djerba.mergers.gene_information_merger.factory import factory as gim_factory
@@ -29,19 +29,12 @@ class fusion_reader(logger):
         self.input_dir = input_dir
         fusion_data = self.read_fusion_data()
         annotations = self.read_annotation_data()
-        # delly results have been removed from fusion data; also remove delly from annotations
-        for key in [k for k in annotations.keys() if k not in fusion_data]:
-            del annotations[key]
-        # now check the key sets match
-        if set(fusion_data.keys()) != set(annotations.keys()):
-            msg = "Distinct fusion identifiers and annotations do not match. "+\
-                  "Fusion data: {0}; ".format(sorted(list(set(fusion_data.keys()))))+\
-                  "Annotations: {0}".format(sorted(list(set(annotations.keys()))))
-            self.logger.error(msg)
-            raise RuntimeError(msg)
+        # fusion data and annotations are merged in a single pass by the
+        # collator, which pops each annotation as it is consumed; leftover
+        # annotation keys are delly rows already excluded from fusion data
         [fusions, self.total_fusion_genes, self.total_oncokb_fusions, self.total_nccn_fusions] = self._collate_row_data(fusion_data, annotations)
         # sort the fusions by fusion ID
-        self.fusions = sorted(fusions, key=lambda f: f.get_fusion_id_new())
+        self.fusions = sorted(fusions, key=lambda f: f.fusion_id_new)
         
     def _collate_row_data(self, fusion_data, annotations):
         fusions = []
@@ -49,55 +42,62 @@ class fusion_reader(logger):
         self.logger.debug("Starting to collate fusion table data.")
         intragenic = 0
         nccn_fusion_total = 0
-        NCCN_fusions = set()
-        with open(os.path.join(self.input_dir, fc.DATA_FUSIONS_NCCN_ANNOTATED)) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                NCCN_fusions.add(row['Fusion'])
-        for fusion_id in fusion_data.keys():
+        # NCCN fusion IDs were recorded when the annotation file was read;
+        # no need to open it a second time
+        NCCN_fusions = self.nccn_fusion_ids
+        # hoist per-iteration attribute lookups out of the hot loop
+        hugo_symbol = fc.HUGO_SYMBOL
+        parse_level_and_therapies = oncokb_levels.parse_level_and_therapies
+        for fusion_id, fusion_rows in fusion_data.items():
+            ann_rows = annotations.pop(fusion_id, None)
+            if ann_rows is None:
+                msg = "Fusion ID {0} in fusion data ".format(fusion_id)+\
+                      "has no matching annotation"
+                self.logger.error(msg)
+                raise RuntimeError(msg)
+            first_row = fusion_rows[0] # look up the list and lead row once per fusion
             gene2_exists = True
-            if len(fusion_data[fusion_id])==1:
+            if len(fusion_rows)==1:
                 # skip intragenic fusions, but add to the gene count
-                fusion_genes.add(fusion_data[fusion_id][0][fc.HUGO_SYMBOL])
+                fusion_genes.add(first_row[hugo_symbol])
                 if fusion_id in NCCN_fusions:
-                    self.logger.debug("Fusion {0} rescued by NCCN annotation".format(fusion))
+                    self.logger.debug("Fusion {0} rescued by NCCN annotation".format(fusion_id))
                     gene2_exists = False
                     gene2 = "Intergenic"
                     nccn_fusion_total += 1
                 else:
                     intragenic += 1
                     continue
-            elif len(fusion_data[fusion_id]) >= 3:
+            elif len(fusion_rows) >= 3:
                 msg = "More than 2 fusions with the same name: {0}".format(fusion_id)
                 self.logger.error(msg)
                 raise RuntimeError(msg)
-            gene1 = fusion_data[fusion_id][0][fc.HUGO_SYMBOL]
+            gene1 = first_row[hugo_symbol]
             if gene2_exists:
-                gene2 = fusion_data[fusion_id][1][fc.HUGO_SYMBOL]
-                fusion_genes.add(gene1)
-                fusion_genes.add(gene2)
+                gene2 = fusion_rows[1][hugo_symbol]
+                # one C-level update call per fusion, instead of two adds
+                fusion_genes.update((gene1, gene2))
             if gene2_exists:
-                for row_input in annotations[fusion_id]:
+                for row_input in ann_rows:
                     effect = row_input['MUTATION_EFFECT']
-                level = oncokb_levels.parse_oncokb_level(row_input)
+                # parse level and therapies in a single pass over the row
+                level, therapies = parse_level_and_therapies(row_input)
             else:
                 effect = "Undetermined"
                 level = "P"
+                therapies = {"P": "Prognostic"}
             if level not in ['Unknown', 'NA']:
-                if gene2_exists:
-                    therapies = oncokb_levels.parse_actionable_therapies(row_input)
-                else:
-                    therapies = {"P": "Prognostic"}
                 fusions.append(
                     fusion(
                         fusion_id,
-                        fusion_data[fusion_id][0]['Fusion_newStyle'],
+                        first_row['Fusion_newStyle'],
                         gene1,
                         gene2,
-                        fusion_data[fusion_id][0]['Frame'],
+                        first_row['Frame'],
                         effect,
                         level,
                         therapies,
-                        fusion_data[fusion_id][0]['translocation']
+                        first_row['translocation']
                     )
                 )
         total = len(fusions) - nccn_fusion_total
@@ -117,6 +117,8 @@ class fusion_reader(logger):
         gene = genes[0]
         factory = tom_factory(self.log_level, self.log_path)
         entries = []
+        # the URL does not depend on the level; build it once for all entries
+        alteration_url = hb.build_fusion_url(genes, oncotree_code.lower())
         for level in therapies.keys():
             entry = factory.get_json(
                 tier=oncokb_levels.tier(level),
@@ -124,7 +126,7 @@ class fusion_reader(logger):
                 treatments=therapies[level],
                 gene=gene,
                 alteration='Fusion',
-                alteration_url=hb.build_fusion_url(genes, oncotree_code.lower())
+                alteration_url=alteration_url
             )
             entries.append(entry)
         return entries
@@ -138,7 +140,7 @@ class fusion_reader(logger):
                 tier=oncokb_levels.tier(level),
                 level=level,
                 treatments=therapies[level],
-                gene=fusion.get_translocation(),
+                gene=fusion.translocation,
                 alteration='Fusion',
                 #TODO: pull URL from NCCN_annotation.txt
                 alteration_url="https://www.nccn.org/professionals/physician_gls/pdf/myeloma_blocks.pdf"
@@ -158,7 +160,7 @@ class fusion_reader(logger):
         # retain fusions with sort order less than (ie. ahead of) 'Likely Oncogenic'
         maximum_order = oncokb_levels.oncokb_order('P')
         for fusion in gene_pair_fusions:
-            oncokb_order = oncokb_levels.oncokb_order(fusion.get_oncokb_level())
+            oncokb_order = oncokb_levels.oncokb_order(fusion.level)
             if oncokb_order <= maximum_order:
                 for gene in fusion.get_genes():
                     chromosome = cytobands.get(gene)
@@ -168,11 +170,11 @@ class fusion_reader(logger):
                         fc.GENE_URL: gene_url,
                         fc.CHROMOSOME: chromosome,
                         fc.ONCOKB_LINK: fusion.get_oncokb_link(oncotree_code),
-                        fc.FRAME: fusion.get_frame(),
-                        fc.TRANSLOCATION: fusion.get_translocation(),
-                        fc.FUSION: fusion.get_fusion_id_new(),
-                        fc.MUTATION_EFFECT: fusion.get_mutation_effect(),
-                        core_constants.ONCOKB: fusion.get_oncokb_level()
+                        fc.FRAME: fusion.frame,
+                        fc.TRANSLOCATION: fusion.translocation,
+                        fc.FUSION: fusion.fusion_id_new,
+                        fc.MUTATION_EFFECT: fusion.effect,
+                        core_constants.ONCOKB: fusion.level
                     }
                     rows.append(row)
                     gene_info_entry = gene_info_factory.get_json(
@@ -180,22 +182,24 @@ class fusion_reader(logger):
                         summary=summaries.get(gene)
                     )
                     gene_info.append(gene_info_entry)
-                    therapies = fusion.get_therapies()
-                    for level in therapies.keys():
-                        if oncokb_order != oncokb_levels.oncokb_order('P'):
-                            entries = self.build_treatment_entries(
-                                fusion,
-                                therapies,
-                                oncotree_code.lower()
-                            )
-                            treatment_opts.extend(entries)
-                        else:
-                            entries = self.build_treatment_entries_nccn(
-                                fusion,
-                                therapies,
-                                oncotree_code.lower()
-                            )
-                            treatment_opts.extend(entries)
+                therapies = fusion.therapies
+                if therapies:
+                    # build entries once per fusion; the builders already make
+                    # one entry per level, so repeating them per gene and per
+                    # level only made duplicates for the merger to deduplicate
+                    if oncokb_order != oncokb_levels.oncokb_order('P'):
+                        entries = self.build_treatment_entries(
+                            fusion,
+                            therapies,
+                            oncotree_code
+                        )
+                    else:
+                        entries = self.build_treatment_entries_nccn(
+                            fusion,
+                            therapies,
+                            oncotree_code
+                        )
+                    treatment_opts.extend(entries)
         return rows, gene_info, treatment_opts
     
     def get_fusions(self):
@@ -212,41 +216,35 @@ class fusion_reader(logger):
 
     def read_annotation_data(self):
         # annotation file has exactly 1 line per fusion
-        annotations_by_fusion = {}
-        with open(os.path.join(self.input_dir, fc.DATA_FUSIONS_ANNOTATED)) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                fusion = row['Fusion']
-                if fusion in annotations_by_fusion:
-                    annotations_by_fusion[fusion].append(row)
-                else:
-                    annotations_by_fusion[fusion] = [row,]
-        with open(os.path.join(self.input_dir, fc.DATA_FUSIONS_NCCN_ANNOTATED)) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                fusion = row['Fusion']
-                if fusion in annotations_by_fusion:
-                    annotations_by_fusion[fusion].append(row)
-                else:
-                    annotations_by_fusion[fusion] = [row,]
+        # the NCCN fusion IDs are recorded in the same pass, for the collator
+        annotations_by_fusion = defaultdict(list)
+        self.nccn_fusion_ids = set()
+        in_path = os.path.join(self.input_dir, fc.DATA_FUSIONS_ANNOTATED)
+        data = pd.read_csv(in_path, sep="\t", dtype=str, keep_default_na=False)
+        for row in data.to_dict(orient='records'):
+            annotations_by_fusion[row['Fusion']].append(row)
+        nccn_path = os.path.join(self.input_dir, fc.DATA_FUSIONS_NCCN_ANNOTATED)
+        nccn_data = pd.read_csv(nccn_path, sep="\t", dtype=str, keep_default_na=False)
+        for row in nccn_data.to_dict(orient='records'):
+            self.nccn_fusion_ids.add(row['Fusion'])
+            annotations_by_fusion[row['Fusion']].append(row)
         return annotations_by_fusion
 
     def read_fusion_data(self):
         # data file has 1 or 2 lines per fusion (1 if it has an intragenic component, 2 otherwise)
-        data_by_fusion = {}
-        with open(os.path.join(self.input_dir, fc.DATA_FUSIONS_OLD)) as data_file:
-            delly_count = 0
-            total = 0
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                total += 1
-                if row['Method']=='delly':
-                    # omit delly structural variants (which are not yet validated)
-                    delly_count += 1
-                else:
-                    # make fusion ID consistent with format in annotated file
-                    fusion_id = re.sub('None', 'intragenic', row['Fusion'])
-                    if fusion_id in data_by_fusion:
-                        data_by_fusion[fusion_id].append(row)
-                    else:
-                        data_by_fusion[fusion_id] = [row,]
+        # old-style and new-style fusion IDs both come from this file, so no
+        # separate old-to-new delimiter map is kept in memory
+        data_by_fusion = defaultdict(list)
+        in_path = os.path.join(self.input_dir, fc.DATA_FUSIONS_OLD)
+        data = pd.read_csv(in_path, sep="\t", dtype=str, keep_default_na=False)
+        total = len(data)
+        # omit delly structural variants (which are not yet validated)
+        keep = data['Method'] != 'delly'
+        delly_count = total - int(keep.sum())
+        for row in data[keep].to_dict(orient='records'):
+            # make fusion ID consistent with format in annotated file
+            fusion_id = row['Fusion'].replace('None', 'intragenic')
+            data_by_fusion[fusion_id].append(row)
         self.logger.debug("Read {0} rows of fusion input; excluded {1} delly rows".format(total, delly_count))
         return data_by_fusion
 
@@ -280,7 +278,8 @@ class prepare_fusions(logger):
         fus_path = os.path.join(self.input_dir, 'fus.txt') 
         self.logger.info("Processing fusion results from " + mavis_path)
         # prepend a column with the tumour ID to the Mavis .tab output
-        with open(mavis_path, 'rt') as in_file, open(fus_path, 'wt') as out_file:
+        with open(mavis_path, 'rt', newline='') as in_file, \
+             open(fus_path, 'wt', newline='') as out_file:
             reader = csv.reader(in_file, delimiter="\t")
             writer = csv.writer(out_file, delimiter="\t")
             in_header = True
@@ -310,6 +309,19 @@ class prepare_fusions(logger):
 
 class fusion:
     # container for data relevant to reporting a fusion
+    # slots in place of a per-instance dict; reports may hold many fusions
+
+    __slots__ = (
+        'fusion_id_old',
+        'fusion_id_new',
+        'gene1',
+        'gene2',
+        'frame',
+        'translocation',
+        'effect',
+        'therapies',
+        'level'
+    )
 
     def __init__(
             self,
@@ -333,21 +345,9 @@ class fusion:
         self.therapies = therapies
         self.level = level
 
-    def get_fusion_id_old(self):
-        return self.fusion_id_old
-
-    def get_fusion_id_new(self):
-        return self.fusion_id_new
-
     def get_genes(self):
         return [self.gene1, self.gene2]
 
-    def get_translocation(self):
-        return self.translocation
-
-    def get_frame(self):
-        return self.frame
-
     def get_oncokb_link(self, oncotree):
         #need to both make the URL and then make the HTML for the URL
         gene1_url = hb.build_onefusion_url(self.gene1, oncotree)
@@ -356,18 +356,6 @@ class fusion:
         gene2_and_url = hb.href(gene2_url, self.gene2)
         return("::".join((gene1_and_url, gene2_and_url)))
 
-    def get_oncokb_level(self):
-        return self.level
-
-    def get_mutation_effect(self):
-        return self.effect
-
-    def get_fda_level(self):
-        return self.fda_level
-
-    def get_therapies(self):
-        return self.therapies
-
 
 
 
@@ -98,10 +98,10 @@ class msi_processor(logger):
             msi_path = os.path.join(work_dir, constants.MSI_FILE_NAME)
         self.validator.validate_input_file(msi_path)
         with open(msi_path, 'r') as msi_file:
-            reader_file = csv.reader(msi_file, delimiter="\t")
-            for row in reader_file:
+            # summary file has a single row; plain split avoids csv overhead
+            for row in msi_file.read().splitlines():
                 try:
-                    msi_value = float(row[2])
+                    msi_value = float(row.split('\t')[2])
                 except IndexError as err:
                     msg = "Incorrect number of columns in msisensor row: '{0}'".format(row) + \
                           "read from '{0}'".format(os.path.join(work_dir, constants.MSI_FILE_NAME))
@@ -3,7 +3,7 @@ Plugin for genomic landscape section.
 """
 import csv
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 
 import djerba.core.constants as core_constants
 import djerba.plugins.genomic_landscape.constants as glc
@@ -110,19 +110,26 @@ class main(plugin_base):
         results[glc.CAN_REPORT_HRD] = hrd_ok
         results[glc.CAN_REPORT_MSI] = msi_ok
         # evaluate biomarkers
-        results[glc.CTDNA] = ctdna_processor(self.log_level, self.log_path).run(wrapper.get_my_string(glc.CTDNA_FILE))
-        hrd = hrd_processor(self.log_level, self.log_path)
-        results[glc.BIOMARKERS][glc.HRD] = hrd.run(
-            work_dir,
-            wrapper.get_my_string(glc.HRDETECT_PATH)
-        )
-        results[glc.BIOMARKERS][glc.MSI] = msi_processor(self.log_level, self.log_path).run(
-            work_dir,
-            r_script_dir,
-            wrapper.get_my_string(glc.MSI_FILE),
-            biomarkers_path,
-            tumour_id
-        )
+        # MSI processing spawns an R plot subprocess with no dependency on the
+        # ctDNA or HRD steps, so it runs concurrently with them; the TMB row is
+        # already in the biomarkers MAF, keeping the append order deterministic
+        msi = msi_processor(self.log_level, self.log_path)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            msi_future = executor.submit(
+                msi.run,
+                work_dir,
+                r_script_dir,
+                wrapper.get_my_string(glc.MSI_FILE),
+                biomarkers_path,
+                tumour_id
+            )
+            results[glc.CTDNA] = ctdna_processor(self.log_level, self.log_path).run(wrapper.get_my_string(glc.CTDNA_FILE))
+            hrd = hrd_processor(self.log_level, self.log_path)
+            results[glc.BIOMARKERS][glc.HRD] = hrd.run(
+                work_dir,
+                wrapper.get_my_string(glc.HRDETECT_PATH)
+            )
+            results[glc.BIOMARKERS][glc.MSI] = msi_future.result()
         # Annotate genomic biomarkers for therapy info/merge inputs
         annotated_maf = self.annotate_oncokb(work_dir, wrapper)
         merge_inputs = self.get_oncokb_merge_inputs(annotated_maf, msi_ok)
@@ -161,7 +168,7 @@ class main(plugin_base):
         # evaluate reportability for HRD and MSI metrics
         self.logger.debug('Evaluating reportability for purity and sample type')
         sample_is_ffpe = False
-        if re.search('FFPE', sample_type.upper()):
+        if 'FFPE' in sample_type.upper():
             sample_is_ffpe = True
             self.logger.debug('FFPE sample detected')
         elif sample_type == glc.UNKNOWN_SAMPLE_TYPE:
@@ -190,11 +197,11 @@ class main(plugin_base):
         # read the tab-delimited input file
         treatments = []
         treatment_option_factory = tom_factory(self.log_level, self.log_path)
-        with open(annotated_maf_path) as input_file:
+        with open(annotated_maf_path, newline='', buffering=1048576) as input_file:
             reader = csv.DictReader(input_file, delimiter="\t")
             for row_input in reader:
                 alteration = row_input['ALTERATION']
-                if re.search('MSI', alteration.upper()) and not msi_ok:
+                if 'MSI' in alteration.upper() and not msi_ok:
                     self.logger.debug('Omitting MSI from therapies: {0}'.format(alteration))
                     continue
                 # record therapy for all actionable alterations (OncoKB level 4 or higher)
@@ -224,9 +231,9 @@ class main(plugin_base):
     def get_alt_url(self, alteration):
         core_biomarker_url = "https://www.oncokb.org/gene/Other%20Biomarkers"
         if alteration == "TMB-H":
-            alt_url = '/'.join([core_biomarker_url, "TMB-H/"])
+            alt_url = core_biomarker_url+"/TMB-H/"
         elif alteration == "MSI-H":
-            alt_url = '/'.join([core_biomarker_url, "Microsatellite%20Instability-High/"])
+            alt_url = core_biomarker_url+"/Microsatellite%20Instability-High/"
         else:
             msg = "Unknown alteration '{0}', cannot generate URL".format(alteration)
             self.logger.error(msg)
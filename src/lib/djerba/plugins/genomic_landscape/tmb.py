@@ -1,11 +1,35 @@
-import csv
+import functools
 import os
 
+import numpy
+import pandas
+
 import djerba.plugins.genomic_landscape.constants as constants
 from djerba.util.image_to_base64 import converter
 from djerba.util.logger import logger
 from djerba.util.subprocess_runner import subprocess_runner
-from statsmodels.distributions.empirical_distribution import ECDF
+
+@functools.lru_cache(maxsize=8)
+def _load_tmb_arrays(data_path, mtime):
+    """Sorted TMB arrays by cancer type, plus the pan-cancer pool; cached by
+    path and mtime, as the cohort files are re-read for every percentile"""
+    data = pandas.read_csv(
+        data_path,
+        delimiter="\t",
+        usecols=[constants.CANCER_TYPE_HEADER, constants.TMB_HEADER]
+    )
+    by_type = {
+        cancer_type: numpy.sort(values.to_numpy(dtype=numpy.float64))
+        for cancer_type, values
+        in data.groupby(constants.CANCER_TYPE_HEADER)[constants.TMB_HEADER]
+    }
+    all_values = numpy.sort(data[constants.TMB_HEADER].to_numpy(dtype=numpy.float64))
+    return by_type, all_values
+
+def _tmb_percentile(tmb_array, tmb):
+    # empirical CDF evaluated at tmb; a sorted array plus searchsorted is
+    # equivalent to the statsmodels ECDF, without rebuilding it per call
+    return 100.0 * numpy.searchsorted(tmb_array, tmb, side='right') / tmb_array.size
 
 
 class tmb_processor(logger):
@@ -73,9 +97,6 @@ class tmb_processor(logger):
 
     def read_cancer_specific_percentile(self, data_dir, tmb, cohort, cancer_type):
         # Read percentile for given TMB/Mb and cohort
-        # We use statsmodels to compute the ECDF
-        # See: https://stackoverflow.com/a/15792672
-        # Introduces dependency on Pandas, but still the most convenient solution
         if cohort == constants.NA:
             percentile = constants.NA
         else:
@@ -83,13 +104,10 @@ class tmb_processor(logger):
                 data_filename = constants.TMBCOMP_EXTERNAL
             else:
                 data_filename = constants.TMBCOMP_TCGA
-            tmb_array = []
-            with open(os.path.join(data_dir, data_filename)) as data_file:
-                for row in csv.DictReader(data_file, delimiter="\t"):
-                    if row[constants.CANCER_TYPE_HEADER] == cancer_type:
-                        tmb_array.append(float(row[constants.TMB_HEADER]))
-            ecdf = ECDF(tmb_array)
-            percentile = int(round(ecdf(tmb) * 100, 0))  # return an integer percentile
+            data_path = os.path.join(data_dir, data_filename)
+            by_type, all_values = _load_tmb_arrays(data_path, os.path.getmtime(data_path))
+            tmb_array = by_type[cancer_type]
+            percentile = int(round(_tmb_percentile(tmb_array, tmb), 0))  # return an integer percentile
         return percentile
 
     def read_cohort(self, data_dir, tcga_code):
@@ -101,11 +119,9 @@ class tmb_processor(logger):
         # Note: cohort in case (1) is really the Source column in tmbcomp-externaldata.txt
         # but for now this only has one value
         # TODO need to define a procedure for adding more data cohorts
-        tcga_cancer_types = set()
-        with open(os.path.join(data_dir, constants.TMBCOMP_TCGA)) as tcga_file:
-            reader = csv.reader(tcga_file, delimiter="\t")
-            for row in reader:
-                tcga_cancer_types.add(row[3])
+        data_path = os.path.join(data_dir, constants.TMBCOMP_TCGA)
+        by_type, all_values = _load_tmb_arrays(data_path, os.path.getmtime(data_path))
+        tcga_cancer_types = by_type.keys() # cached; no extra scan of the file
         if tcga_code.lower() == 'paad':
             cohort = constants.COMPASS
         elif tcga_code.lower() in tcga_cancer_types:
@@ -116,23 +132,23 @@ class tmb_processor(logger):
 
     def read_fga(self, work_dir):
         input_path = os.path.join(work_dir, constants.DATA_SEGMENTS)
-        total = 0
-        with open(input_path) as input_file:
-            for row in csv.DictReader(input_file, delimiter="\t"):
-                if abs(float(row['seg.mean'])) >= constants.MINIMUM_MAGNITUDE_SEG_MEAN:
-                    total += int(row['loc.end']) - int(row['loc.start'])
+        # columnar read of the segment file; vector ops replace the per-row loop
+        seg = pandas.read_csv(
+            input_path,
+            delimiter="\t",
+            usecols=['loc.start', 'loc.end', 'seg.mean'],
+            na_values=['NA']
+        )
+        altered = seg['seg.mean'].abs() >= constants.MINIMUM_MAGNITUDE_SEG_MEAN
+        total = int((seg['loc.end'][altered] - seg['loc.start'][altered]).sum())
         # TODO see GCGI-347 for possible updates to genome size
         fga = float(total) / constants.GENOME_SIZE
         return fga
 
     def read_pan_cancer_percentile(self, data_dir, tmb):
-        tmb_array = []
-        with open(os.path.join(data_dir, constants.TMBCOMP_TCGA)) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                tmb_array.append(float(row[constants.TMB_HEADER]))
-        ecdf = ECDF(tmb_array)
-        percentile = ecdf(tmb) * 100
-        return percentile
+        data_path = os.path.join(data_dir, constants.TMBCOMP_TCGA)
+        by_type, all_values = _load_tmb_arrays(data_path, os.path.getmtime(data_path))
+        return _tmb_percentile(all_values, tmb)
 
     def get_tmb_count(self, work_dir):
         # Count the somatic mutations
@@ -140,15 +156,18 @@ class tmb_processor(logger):
         # Splice_Region mutations are of interest to us, but excluded from the standard TMB definition
         # The TMB mutation count is (independently) implemented and used in vaf_plot.R
         # See JIRA ticket GCGI-496
-        total = 0
-        excluded = 0
         mutations_path = os.path.join(work_dir, constants.MUTATIONS_EXTENDED)
         if os.path.isfile(mutations_path):
-            with open(mutations_path) as data_file:
-                for row in csv.DictReader(data_file, delimiter="\t"):
-                    total += 1
-                    if row.get(constants.VARIANT_CLASSIFICATION) in constants.TMB_EXCLUDED:
-                        excluded += 1
+            # columnar read of the classification column; counting at C level
+            classifications = pandas.read_csv(
+                mutations_path,
+                delimiter="\t",
+                usecols=[constants.VARIANT_CLASSIFICATION],
+                dtype=str,
+                keep_default_na=False
+            )[constants.VARIANT_CLASSIFICATION]
+            total = len(classifications)
+            excluded = int(classifications.isin(constants.TMB_EXCLUDED).sum())
         else:
             msg = "Unable to compute TMB, file "+constants.MUTATIONS_EXTENDED+\
                 " not found in workspace; need to run wgts.snv_indel plugin?"
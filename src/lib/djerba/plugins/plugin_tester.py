@@ -39,8 +39,7 @@ class PluginTester(TestBase):
     def read_plugin_name(self, ini_path):
         """Check for exactly one plugin name in config; raise an error if unsuccessful"""
         path_validator().validate_input_file(ini_path)
-        config = ConfigParser()
-        config.read(ini_path)
+        config = self.load_ini(ini_path)
         plugin_name = None
         for section_name in config.sections():
             if section_name == core_constants.CORE:
@@ -69,9 +68,7 @@ class PluginTester(TestBase):
         # !!! First pass -- load the plugin, run as standalone, do JSON & HTML checks
         loader = plugin_loader(log_level)
         plugin = loader.load(plugin_name, workspace(work_dir, log_level))
-        config = ConfigParser()
-        with open(ini_path) as in_file:
-            config.read_file(in_file)
+        config = self.load_ini(ini_path)
         config.set(core_constants.CORE, core_constants.REPORT_ID, 'placeholder')
         plugin_config = plugin.configure(config)
         self.assertTrue(plugin_config.has_section(plugin_name))
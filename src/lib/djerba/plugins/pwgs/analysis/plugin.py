@@ -25,6 +25,7 @@ class main(plugin_base):
     def configure(self, config):
         config = self.apply_defaults(config)
         wrapper = self.get_config_wrapper(config)
+        path_info = None
         if wrapper.my_param_is_null(pc.RESULTS_FILE):
             path_info = self.workspace.read_json(core_constants.DEFAULT_PATH_INFO)
             results_path = path_info.get(pc.RESULTS_SUFFIX)
@@ -34,7 +35,8 @@ class main(plugin_base):
                 raise RuntimeError(msg)
             wrapper.set_my_param(pc.RESULTS_FILE, results_path)
         if wrapper.my_param_is_null(pc.HBC_FILE):
-            path_info = self.workspace.read_json(core_constants.DEFAULT_PATH_INFO)
+            if path_info == None:
+                path_info = self.workspace.read_json(core_constants.DEFAULT_PATH_INFO)
             hbc_path = path_info.get(pc.HBC_SUFFIX)
             if hbc_path == None:
                 msg = 'Cannot find HBC path for mrdetect input'
@@ -42,9 +44,10 @@ class main(plugin_base):
                 raise RuntimeError(msg)
             wrapper.set_my_param(pc.HBC_FILE, hbc_path)
         if wrapper.my_param_is_null(pc.VAF_FILE):
-            path_info = self.workspace.read_json(core_constants.DEFAULT_PATH_INFO)
+            if path_info == None:
+                path_info = self.workspace.read_json(core_constants.DEFAULT_PATH_INFO)
             vaf_path = path_info.get(pc.VAF_SUFFIX)
-            if results_path == None:
+            if vaf_path == None:
                 msg = 'Cannot find VAF path for mrdetect input'
                 self.logger.error(msg)
                 raise RuntimeError(msg)
@@ -102,26 +105,27 @@ class main(plugin_base):
         """
         summarize healthy blood controls (HBC) file
         """
-        sites_checked = []
-        reads_checked = []
-        sites_detected = []
+        # only the first data row and the row count are needed; stream the
+        # file instead of building a list per column
+        first_row = None
+        total_rows = 0
         with open(hbc_path, 'r') as hbc_file:
             reader_file = csv.reader(hbc_file, delimiter=",")
             next(reader_file, None)
             for row in reader_file:
                 try:
-                    sites_checked.append(row[2])
-                    reads_checked.append(row[3])
-                    sites_detected.append(row[4])
+                    row_values = (row[2], row[3], row[4])
                 except IndexError as err:
                     msg = "Incorrect number of columns in HBC row: '{0}'".format(row) + \
                           "read from '{0}'".format(hbc_path)
                     raise RuntimeError(msg) from err
-        hbc_n = len(sites_detected) - 1
-        hbc_dict = {pc.SITES_CHECKED: int(sites_checked[0]),
-                    pc.READS_CHECKED: int(reads_checked[0]),
-                    pc.SITES_DETECTED: int(sites_detected[0]),
-                    pc.COHORT_N: hbc_n}
+                if first_row is None:
+                    first_row = row_values
+                total_rows += 1
+        hbc_dict = {pc.SITES_CHECKED: int(first_row[0]),
+                    pc.READS_CHECKED: int(first_row[1]),
+                    pc.SITES_DETECTED: int(first_row[2]),
+                    pc.COHORT_N: total_rows - 1}
         return hbc_dict
 
     def preprocess_vaf(self, vaf_path):
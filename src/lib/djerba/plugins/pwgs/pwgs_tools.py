@@ -1,5 +1,4 @@
 """pwgs supporting functions"""
-import csv
 from decimal import Decimal
 import logging
 import re
@@ -11,9 +10,9 @@ def preprocess_results(self, results_path):
     '''Pulls key result numbers from result file output from default mrdetect run'''
     results_dict = {}
     with open(results_path, 'r') as results_file:
-        reader_file = csv.reader(results_file, delimiter="\t")
-        next(reader_file, None)
-        for row in reader_file:
+        # file has a header plus one data row; plain split avoids csv overhead
+        for line in results_file.read().splitlines()[1:]:
+            row = line.split('\t')
             try:
                 results_dict = {
                                 constants.TUMOUR_FRACTION_ZVIRAN: float('%.1E' % Decimal(row[7]))*100,
@@ -1,11 +1,10 @@
 """Djerba plugin for pwgs sample reporting"""
 import os
-import csv
+import functools
 import logging
 import json
-import requests
+import pandas
 
-from mako.lookup import TemplateLookup
 from djerba.plugins.base import plugin_base
 import djerba.plugins.pwgs.constants as pc
 from djerba.core.workspace import workspace
@@ -14,11 +13,20 @@ from djerba.util.subprocess_runner import subprocess_runner
 import djerba.plugins.pwgs.pwgs_tools as pwgs_tools
 from djerba.util.render_mako import mako_renderer
 
-try:
-    import gsiqcetl.column
-    from gsiqcetl import QCETLCache
-except ImportError:
-    raise ImportError('Error Importing QC-ETL, try checking python versions')
+@functools.lru_cache(maxsize=1)
+def get_cached_coverages(qcetl_cache_path):
+    '''load the bamqc4merged table once and index by GroupID for O(1) lookups'''
+    # QC-ETL imports deferred to first use, so merely loading the plugin
+    # (eg. for render) does not read the cache index into memory
+    try:
+        import gsiqcetl.column
+        from gsiqcetl import QCETLCache
+    except ImportError:
+        raise ImportError('Error Importing QC-ETL, try checking python versions')
+    etl_cache = QCETLCache(qcetl_cache_path)
+    columns_of_interest = gsiqcetl.column.BamQc4MergedColumn
+    cached_coverages = etl_cache.bamqc4merged.bamqc4merged
+    return cached_coverages.set_index(columns_of_interest.GroupID, drop=False)
 
 class main(plugin_base):
 
@@ -69,13 +77,16 @@ class main(plugin_base):
 
     def fetch_coverage_etl_data(self, group_id, config):
         '''fetch median insert size and coverage QC metrics from QC-ETL'''
-        self.etl_cache = QCETLCache(config[self.identifier][pc.QCETL_CACHE])
-        cached_coverages = self.etl_cache.bamqc4merged.bamqc4merged
+        import gsiqcetl.column
+        cached_coverages = get_cached_coverages(config[self.identifier][pc.QCETL_CACHE])
         columns_of_interest = gsiqcetl.column.BamQc4MergedColumn
-        data = cached_coverages.loc[
-            (cached_coverages[columns_of_interest.GroupID] == group_id),
-            [columns_of_interest.GroupID, columns_of_interest.CoverageDeduplicated, columns_of_interest.InsertMedian]
-            ]
+        try:
+            data = cached_coverages.loc[
+                [group_id],
+                [columns_of_interest.GroupID, columns_of_interest.CoverageDeduplicated, columns_of_interest.InsertMedian]
+                ]
+        except KeyError:
+            data = cached_coverages.iloc[0:0]
         qc_dict = {}
         if len(data) > 0:
            qc_dict[pc.COVERAGE] = round(data.iloc[0][columns_of_interest.CoverageDeduplicated].item(),1)
@@ -138,11 +149,11 @@ class main(plugin_base):
             data = json.load(bamqc_results)
         is_data = data['insert size histogram']
         file_location = os.path.join(output_dir, 'insert_size_distribution.csv')
-        with open(file_location,'w') as out:
-            csv_out = csv.writer(out)
-            csv_out.writerow(['size','count'])
-            for i in is_data:
-                csv_out.writerow([i,is_data[i]])
+        # single C-level CSV write; histograms can have thousands of bins
+        is_frame = pandas.DataFrame(
+            {'size': list(is_data.keys()), 'count': list(is_data.values())}
+        )
+        is_frame.to_csv(file_location, index=False)
         return(file_location)
     
     def preprocess_snv_count(self, snv_count_path ):
@@ -150,13 +161,13 @@ class main(plugin_base):
         pull SNV count from file
         """
         with open(snv_count_path, 'r') as hbc_file:
-            reader_file = csv.reader(hbc_file, delimiter="\t")
-            for row in reader_file:
-                try: 
-                    snv_count = row[0]
-                except IndexError as err:
+            # only the first column is wanted; plain split avoids csv overhead
+            for line in hbc_file:
+                row = line.rstrip('\r\n')
+                if row == '':
                     msg = "Incorrect number of columns in SNV Count file: '{0}'".format(snv_count_path)
-                    raise RuntimeError(msg) from err
+                    raise RuntimeError(msg)
+                snv_count = row.split('\t', 1)[0]
         return int(snv_count)
     
     def render(self, data):
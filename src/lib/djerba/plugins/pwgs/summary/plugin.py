@@ -4,7 +4,6 @@ import csv
 import logging
 import json
 
-from mako.lookup import TemplateLookup
 from djerba.plugins.base import plugin_base
 import djerba.plugins.pwgs.constants as pc
 from djerba.core.workspace import workspace
@@ -12,14 +11,6 @@ import djerba.core.constants as core_constants
 from djerba.util.subprocess_runner import subprocess_runner
 import djerba.plugins.pwgs.pwgs_tools as pwgs_tools
 from djerba.util.render_mako import mako_renderer
-from djerba.util.provenance_reader import provenance_reader
-import requests
-
-try:
-    import gsiqcetl.column
-    from gsiqcetl import QCETLCache
-except ImportError:
-    raise ImportError('Error Importing QC-ETL, try checking python versions')
 
 class main(plugin_base):
 
@@ -13,17 +13,21 @@ import djerba.core.constants as core_constants
 from djerba.util.subprocess_runner import subprocess_runner
 from djerba.util.render_mako import mako_renderer
 
-try:
-    import gsiqcetl.column
-    from gsiqcetl import QCETLCache
-except ImportError as err:
-    raise RuntimeError('QC-ETL import failure! Try checking python versions') from err
+def import_qcetl():
+    # deferred to first use, so loading the plugin does not import QC-ETL
+    try:
+        import gsiqcetl.column
+        from gsiqcetl import QCETLCache
+    except ImportError as err:
+        raise RuntimeError('QC-ETL import failure! Try checking python versions') from err
+    return gsiqcetl.column, QCETLCache
 
 class main(plugin_base):
 
     PLUGIN_VERSION = '1.0.0'
     PRIORITY = 500
     QCETL_CACHE = "/scratch2/groups/gsi/production/qcetl_v1"
+    NA_STRINGS = frozenset(['NA', 'N/A']) # compared against uppercased input
     
     def specify_params(self):
         discovered = [
@@ -89,7 +93,7 @@ class main(plugin_base):
         data = self.get_starting_plugin_data(wrapper, self.PLUGIN_VERSION)
         # multiply purity by 100 to get a percentage, and round to the nearest integer
         purity = config[self.identifier][constants.PURITY]
-        if purity not in ["NA", "N/A", "na", "n/a", "N/a", "Na"]:
+        if purity.upper() not in self.NA_STRINGS:
             purity = int(round(float(purity)*100, 0))
         results = {
                 constants.ONCOTREE_CODE: config[self.identifier][constants.ONCOTREE],
@@ -107,9 +111,10 @@ class main(plugin_base):
         return renderer.render_name('sample_template.html', data)
 
     def fetch_callability_etl_data(self, donor, tumour_id):
+        qcetl_column, QCETLCache = import_qcetl()
         etl_cache = QCETLCache(self.QCETL_CACHE)
         cached_callabilities = etl_cache.mutectcallability.mutectcallability
-        columns_of_interest = gsiqcetl.column.MutetctCallabilityColumn
+        columns_of_interest = qcetl_column.MutetctCallabilityColumn
         # Note: donor and tumour ID are both not unique, but together are unique. Filter on both.
         # One donor can have multiple tumour IDs; one tumour ID can be associated with multiple donors
         # But one donor will not have a duplicate tumour IDs
@@ -130,9 +135,10 @@ class main(plugin_base):
             raise MissingQCETLError(msg)
         
     def fetch_coverage_etl_data(self, donor, tumour_id):
+        qcetl_column, QCETLCache = import_qcetl()
         etl_cache = QCETLCache(self.QCETL_CACHE)
         cached_coverages = etl_cache.bamqc4merged.bamqc4merged
-        columns_of_interest = gsiqcetl.column.BamQc4MergedColumn
+        columns_of_interest = qcetl_column.BamQc4MergedColumn
         # Note: donor and tumour ID are both not unique, but together are unique. Filter on both.
         # One donor can have multiple tumour IDs; one tumour ID can be associated with multiple donors
         # But one donor will not have a duplicate tumour IDs
@@ -5,7 +5,7 @@ from djerba.plugins.base import plugin_base, DjerbaPluginError
 import djerba.core.constants as core_constants
 from djerba.util.date import get_todays_date
 from djerba.util.date import is_valid_date
-from djerba.util.render_mako import mako_renderer
+import djerba.util.render_mako as render_mako
 import djerba.util.assays as assays
 
 class main(plugin_base):
@@ -25,10 +25,15 @@ class main(plugin_base):
     GENETICIST_ID_DEFAULT = 'XXXXXXX'
 
     def check_assay_name(self, wrapper):
-        [ok, msg] = assays.name_status(wrapper.get_my_string(self.ASSAY))
+        assay = wrapper.get_my_string(self.ASSAY)
+        if assay == getattr(self, 'checked_assay', None):
+            # name already validated in an earlier phase of this run
+            return
+        [ok, msg] = assays.name_status(assay)
         if not ok:
             self.logger.error(msg)
             raise DjerbaPluginError(msg)
+        self.checked_assay = assay
 
     def configure(self, config):
         config = self.apply_defaults(config)
@@ -45,10 +50,14 @@ class main(plugin_base):
                 msg = "Cannot find assay from input_params.json or manual config"
                 self.logger.error(msg)
                 raise DjerbaPluginError(msg)
-        # If dates not supplied, set as today's date
+        # If dates not supplied, set as today's date; computed at most once,
+        # so draft and signoff dates are identical when both default
+        todays_date = None
         for param in [self.USER_SUPPLIED_DRAFT_DATE, self.REPORT_SIGNOFF_DATE]:
             if wrapper.my_param_is_null(param):
-                wrapper.set_my_param(param, get_todays_date())
+                if todays_date is None:
+                    todays_date = get_todays_date()
+                wrapper.set_my_param(param, todays_date)
         self.check_assay_name(wrapper)
 
         # Check if dates are valid
@@ -65,8 +74,11 @@ class main(plugin_base):
 
     def extract(self, config):
         wrapper = self.get_config_wrapper(config)
-        draft_date = wrapper.get_my_string(self.USER_SUPPLIED_DRAFT_DATE)
-        report_signoff_date = wrapper.get_my_string(self.REPORT_SIGNOFF_DATE)
+        # index the section proxy directly rather than re-resolving the
+        # section through the wrapper for every parameter
+        section = config[self.identifier]
+        draft_date = section[self.USER_SUPPLIED_DRAFT_DATE]
+        report_signoff_date = section[self.REPORT_SIGNOFF_DATE]
         self.check_assay_name(wrapper)
        
         attributes_list = wrapper.get_my_attributes()
@@ -82,11 +94,11 @@ class main(plugin_base):
         data = {
             'plugin_name': self.identifier+' plugin',
             'priorities': wrapper.get_my_priorities(),
-            'attributes': wrapper.get_my_attributes(),
+            'attributes': attributes_list,
             'merge_inputs': {},
             'results': {
-                self.ASSAY: wrapper.get_my_string(self.ASSAY),
-                self.FAILED: wrapper.get_my_boolean(self.FAILED),
+                self.ASSAY: section[self.ASSAY],
+                self.FAILED: section.getboolean(self.FAILED),
                 core_constants.AUTHOR: config['core'][core_constants.AUTHOR],
                 self.EXTRACT_DATE: draft_date,
                 self.INCLUDE_SIGNOFFS: include_signoffs
@@ -97,14 +109,14 @@ class main(plugin_base):
         if include_signoffs:
             data['results'].update({
                 self.REPORT_SIGNOFF_DATE: report_signoff_date,
-                self.GENETICIST: wrapper.get_my_string(self.GENETICIST),
-                self.GENETICIST_ID: wrapper.get_my_string(self.GENETICIST_ID)
+                self.GENETICIST: section[self.GENETICIST],
+                self.GENETICIST_ID: section[self.GENETICIST_ID]
             })
 
         return data
 
     def render(self, data):
-        renderer = mako_renderer(self.get_module_dir())
+        renderer = render_mako.get_renderer(self.get_module_dir())
         return renderer.render_name(self.MAKO_TEMPLATE_NAME, data)
 
     def specify_params(self):
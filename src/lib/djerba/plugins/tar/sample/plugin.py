@@ -1,21 +1,30 @@
 import os
-import csv
+import functools
 import logging
 import json
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 
-from mako.lookup import TemplateLookup
 from djerba.plugins.base import plugin_base
 import djerba.plugins.tar.sample.constants as constants
-from djerba.core.workspace import workspace
+from djerba.core.workspace import workspace, json_loads
 import djerba.core.constants as core_constants
 from djerba.util.subprocess_runner import subprocess_runner
-from djerba.util.render_mako import mako_renderer
-try:
-    import gsiqcetl.column
-    from gsiqcetl import QCETLCache
-except ImportError as err:
-    raise RuntimeError('QC-ETL import failure! Try checking python versions') from err
+import djerba.util.render_mako as render_mako
+
+@functools.lru_cache(maxsize=1)
+def get_cached_coverages(qcetl_cache_path):
+    '''load the hsmetrics table once and index by GroupID for O(1) lookups'''
+    # QC-ETL imports deferred to first use, so merely loading the plugin
+    # (eg. for render) does not read the cache index into memory
+    try:
+        import gsiqcetl.column
+        from gsiqcetl import QCETLCache
+    except ImportError as err:
+        raise RuntimeError('QC-ETL import failure! Try checking python versions') from err
+    etl_cache = QCETLCache(qcetl_cache_path)
+    columns_of_interest = gsiqcetl.column.HsMetricsColumn
+    cached_coverages = etl_cache.hsmetrics.metrics
+    return cached_coverages.set_index(columns_of_interest.GroupID, drop=False)
 
 class main(plugin_base):
 
@@ -63,16 +72,27 @@ class main(plugin_base):
             constants.WF_CONSENSUS_NORMAL
         )
 
+        # Raw coverage from QC-ETL and collapsed coverages for Pl and BC read
+        # independent files/caches, so their blocking I/O can overlap
+        tasks = {}
         if wrapper.my_param_is_null(constants.RAW_COVERAGE):
-            qc_dict = self.fetch_coverage_etl_data(config[self.identifier][constants.GROUP_ID])
-            wrapper.set_my_param(constants.RAW_COVERAGE, qc_dict[constants.RAW_COVERAGE])
-
-        # Get values for collapsed coverage for Pl and BC and put in config for QC reporting
+            tasks[constants.RAW_COVERAGE] = lambda: self.fetch_coverage_etl_data(
+                config[self.identifier][constants.GROUP_ID]
+            )[constants.RAW_COVERAGE]
         if wrapper.my_param_is_null(constants.COVERAGE_PL):
-            wrapper.set_my_param(constants.COVERAGE_PL, self.process_consensus_cruncher(config[self.identifier][constants.CONSENSUS_FILE]))
+            tasks[constants.COVERAGE_PL] = lambda: self.process_consensus_cruncher(
+                config[self.identifier][constants.CONSENSUS_FILE]
+            )
         if wrapper.my_param_is_null(constants.COVERAGE_BC):
-            wrapper.set_my_param(constants.COVERAGE_BC, self.process_consensus_cruncher(config[self.identifier][constants.CONSENSUS_NORMAL_FILE]))
-        
+            tasks[constants.COVERAGE_BC] = lambda: self.process_consensus_cruncher(
+                config[self.identifier][constants.CONSENSUS_NORMAL_FILE]
+            )
+        if len(tasks) > 0:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {key: executor.submit(task) for key, task in tasks.items()}
+                for key, future in futures.items():
+                    wrapper.set_my_param(key, future.result())
+
         return wrapper.get_config()
     
     def extract(self, config):
@@ -89,7 +109,7 @@ class main(plugin_base):
         self.write_purity(purity, work_dir)
 
         # If purity is <10%, only report as <10% (not exact number)
-        rounded_purity = float('%.1E' % Decimal(purity*100))
+        rounded_purity = float('{0:.1e}'.format(purity*100))
         if rounded_purity < 10:
             rounded_purity = "<10%"
 
@@ -105,10 +125,16 @@ class main(plugin_base):
         return data
 
     def fetch_coverage_etl_data(self, group_id):
-        etl_cache = QCETLCache(self.QCETL_CACHE)
-        cached_coverages = etl_cache.hsmetrics.metrics
+        import gsiqcetl.column
+        cached_coverages = get_cached_coverages(self.QCETL_CACHE)
         columns_of_interest = gsiqcetl.column.HsMetricsColumn
-        data = cached_coverages.loc[ (cached_coverages[columns_of_interest.GroupID] == group_id),  [columns_of_interest.GroupID, columns_of_interest.MeanBaitCoverage] ]
+        try:
+            data = cached_coverages.loc[
+                [group_id],
+                [columns_of_interest.GroupID, columns_of_interest.MeanBaitCoverage]
+                ]
+        except KeyError:
+            data = cached_coverages.iloc[0:0]
         qc_dict = {}
         if len(data) > 0:
            qc_dict[constants.RAW_COVERAGE] = int(round(data.iloc[0][columns_of_interest.MeanBaitCoverage].item(),0))
@@ -118,27 +144,28 @@ class main(plugin_base):
         return(qc_dict)
 
     def render(self, data):
-        renderer = mako_renderer(self.get_module_dir())
+        renderer = render_mako.get_renderer(self.get_module_dir())
         return renderer.render_name('sample_template.html', data)
 
     def process_ichor_json(self, ichor_metrics):
         with open(ichor_metrics, 'r') as ichor_results:
-            ichor_json = json.load(ichor_results)
+            ichor_json = json_loads(ichor_results.read())
         return(ichor_json)
 
     def process_consensus_cruncher(self, consensus_cruncher_file):
-        header_line = False
+        # tiny fixed-format file: find the BAIT_SET header line and take
+        # column 9 of the row after it, without csv tokenization
         with open(consensus_cruncher_file, 'r') as cc_file:
-            reader_file = csv.reader(cc_file, delimiter="\t")
-            for row in reader_file:
-                if row:
-                    if row[0] == "BAIT_SET" :
-                        header_line = True
-                    elif header_line:
-                        unique_coverage = float(row[9]) 
-                        header_line = False
-                    else:
-                        next
+            text = cc_file.read()
+        # anchor the search to a line starting with a BAIT_SET field, so that
+        # eg. BAIT_SET_NAME or a literal BAIT_SET= argument in the Picard
+        # comment block cannot match
+        if text.startswith('BAIT_SET\t'):
+            header_start = 0
+        else:
+            header_start = text.index('\nBAIT_SET\t') + 1
+        metrics_line = text[header_start:].split('\n', 2)[1]
+        unique_coverage = float(metrics_line.split('\t')[9])
         return(int(round(unique_coverage, 0)))
 
     def specify_params(self):
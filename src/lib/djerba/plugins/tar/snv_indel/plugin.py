@@ -231,7 +231,8 @@ class main(plugin_base):
           reader = csv.DictReader(input_file, delimiter="\t")
           for row_input in reader:
               # record the gene for all reportable alterations
-              level = oncokb_levels.parse_oncokb_level(row_input)
+              # level and therapies are parsed in one pass over the row
+              level, therapies = oncokb_levels.parse_level_and_therapies(row_input)
               if level not in ['Unknown', 'NA']:
                   gene = row_input[sic.HUGO_SYMBOL_TITLE_CASE]
                   gene_info_entry = gene_info_factory.get_json(
@@ -240,7 +241,6 @@ class main(plugin_base):
                   )
                   gene_info.append(gene_info_entry)
               # record therapy for all actionable alterations (OncoKB level 4 or higher)
-              therapies = oncokb_levels.parse_actionable_therapies(row_input)
               for level in therapies.keys():
                   alteration = row_input[sic.HGVSP_SHORT]
                   alteration_url = hb.build_alteration_url(gene, alteration, oncotree_code)
@@ -27,31 +27,35 @@ class data_builder:
     
     def build_small_mutations_and_indels(self, mutations_file):
         """read in small mutations; output rows for oncogenic mutations"""
-        rows = []
         mutation_expression = {}
         cytobands = self.read_cytoband_map()
-        with open(mutations_file) as data_file:
-            for input_row in csv.DictReader(data_file, delimiter="\t"):
-                gene = input_row[sic.HUGO_SYMBOL_TITLE_CASE]
-                cytoband = cytobands.get(gene, 'Unknown')
-                protein = input_row[sic.HGVSP_SHORT]
-                if 'splice' in input_row[sic.VARIANT_CLASSIFICATION].lower():
-                    protein = 'p.? (' + input_row[sic.HGVSC] + ')'  
-                row = {
-                    sic.GENE: gene,
-                    sic.GENE_URL: hb.build_gene_url(gene),
-                    sic.CHROMOSOME: cytoband,
-                    sic.PROTEIN: protein,
-                    sic.PROTEIN_URL: hb.build_alteration_url(gene, protein, self.oncotree_uc),
-                    sic.MUTATION_TYPE: re.sub('_', ' ', input_row[sic.VARIANT_CLASSIFICATION]),
-                    sic.EXPRESSION_METRIC: mutation_expression.get(gene), # None for WGS assay
-                    sic.VAF_PERCENT: int(round(float(input_row[sic.TUMOUR_VAF]), 2)*100),
-                    sic.TUMOUR_DEPTH: int(input_row[sic.TUMOUR_DEPTH]),
-                    sic.TUMOUR_ALT_COUNT: int(input_row[sic.TUMOUR_ALT_COUNT]),
-                    sic.ONCOKB: oncokb_levels.parse_oncokb_level(input_row)
-                }
-
-                rows.append(row)
+        data = pd.read_csv(mutations_file, sep="\t", dtype=str, keep_default_na=False)
+        genes = data[sic.HUGO_SYMBOL_TITLE_CASE].tolist()
+        classifications = data[sic.VARIANT_CLASSIFICATION]
+        proteins = [
+            'p.? ('+hgvsc+')' if 'splice' in vc.lower() else protein
+            for protein, hgvsc, vc
+            in zip(data[sic.HGVSP_SHORT], data[sic.HGVSC], classifications)
+        ]
+        # assemble output columns, then emit all row dicts in one C-level pass;
+        # column order matches the former per-row dicts
+        frame = pd.DataFrame({
+            sic.GENE: genes,
+            sic.GENE_URL: [hb.build_gene_url(x) for x in genes],
+            sic.CHROMOSOME: [cytobands.get(x, 'Unknown') for x in genes],
+            sic.PROTEIN: proteins,
+            sic.PROTEIN_URL: [
+                hb.build_alteration_url(g, p, self.oncotree_uc)
+                for g, p in zip(genes, proteins)
+            ],
+            sic.MUTATION_TYPE: classifications.str.replace('_', ' ', regex=False),
+            sic.EXPRESSION_METRIC: [mutation_expression.get(x) for x in genes], # None for WGS assay
+            sic.VAF_PERCENT: [int(round(float(x), 2)*100) for x in data[sic.TUMOUR_VAF]],
+            sic.TUMOUR_DEPTH: [int(x) for x in data[sic.TUMOUR_DEPTH]],
+            sic.TUMOUR_ALT_COUNT: [int(x) for x in data[sic.TUMOUR_ALT_COUNT]],
+            sic.ONCOKB: oncokb_levels.parse_oncokb_level_column(data)
+        })
+        rows = frame.to_dict(orient='records')
         rows = self.sort_variant_rows(rows)
         rows = oncokb_levels.filter_reportable(rows)
         return rows
@@ -100,10 +104,15 @@ class data_builder:
     def read_cytoband_map(self):
         input_path = self.cytoband_path
         cytobands = {}
-        with open(input_path) as input_file:
-            reader = csv.DictReader(input_file, delimiter="\t")
+        with open(input_path, newline='') as input_file:
+            reader = csv.reader(input_file, delimiter="\t")
+            # resolve the two wanted field indices once, instead of
+            # building a dict per row
+            header = next(reader)
+            gene_index = header.index(sic.HUGO_SYMBOL_TITLE_CASE)
+            cytoband_index = header.index('Chromosome')
             for row in reader:
-                cytobands[row[sic.HUGO_SYMBOL_TITLE_CASE]] = row['Chromosome']
+                cytobands[row[gene_index]] = row[cytoband_index]
         return cytobands
 
     def read_somatic_mutation_totals(self, mutations_file):
@@ -112,14 +121,15 @@ class data_builder:
         # Splice_Region mutations are of interest to us, but excluded from the standard TMB definition
         # The TMB mutation count is (independently) implemented and used in vaf_plot.R
         # See JIRA ticket GCGI-496
-        total = 0
+        # one data row per line; count lines after the header instead of
+        # parsing each row into a dict
         with open(mutations_file) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                total += 1
+            next(data_file, None)
+            total = sum(1 for line in data_file)
         return total
 
     def reformat_level_string(self, level):
-        return re.sub('LEVEL_', "", level)
+        return level.replace('LEVEL_', '') # literal, no regex needed
 
     def sort_variant_rows(self, rows):
         # sort rows oncokb level, then by cytoband, then by gene name
@@ -126,8 +126,8 @@ class preprocess(logger):
     # find the relevant indices on-the-fly from MAF column headers
     # use this instead of csv.DictReader to preserve the rows for output
     with \
-        gzip.open(maf_path, 'rt', encoding=constants.TEXT_ENCODING) as in_file, \
-        open(tmp_path, 'wt') as tmp_file:
+        gzip.open(maf_path, 'rt', encoding=constants.TEXT_ENCODING, newline='') as in_file, \
+        open(tmp_path, 'wt', newline='') as tmp_file:
         # preprocess the MAF file
         reader = csv.reader(in_file, delimiter="\t")
         writer = csv.writer(tmp_file, delimiter="\t")
@@ -184,12 +184,9 @@ class preprocess(logger):
     return ok
 
   def _read_maf_indices(self, row):
-    indices = {}
-    for i in range(len(row)):
-        key = row[i]
-        if key in self.MAF_KEYS:
-            indices[key] = i
-    if set(indices.keys()) != set(self.MAF_KEYS):
+    wanted = set(self.MAF_KEYS)
+    indices = {key: i for i, key in enumerate(row) if key in wanted}
+    if set(indices.keys()) != wanted:
         msg = "Indices found in MAF header {0} ".format(indices.keys()) +\
                 "do not match required keys {0}".format(self.MAF_KEYS)
         raise RuntimeError(msg)
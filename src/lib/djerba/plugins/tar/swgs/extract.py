@@ -87,10 +87,15 @@ class data_builder:
   def read_cytoband_map(self):
     input_path = self.cytoband_path
     cytobands = {}
-    with open(input_path) as input_file:
-        reader = csv.DictReader(input_file, delimiter="\t")
+    with open(input_path, newline='') as input_file:
+        reader = csv.reader(input_file, delimiter="\t")
+        # resolve the two wanted field indices once, instead of
+        # building a dict per row
+        header = next(reader)
+        gene_index = header.index(self.HUGO_SYMBOL_TITLE_CASE)
+        cytoband_index = header.index('Chromosome')
         for row in reader:
-            cytobands[row[self.HUGO_SYMBOL_TITLE_CASE]] = row['Chromosome']
+            cytobands[row[gene_index]] = row[cytoband_index]
     return cytobands
   
   def sort_variant_rows(self, rows):
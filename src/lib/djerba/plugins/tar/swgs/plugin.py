@@ -6,13 +6,10 @@ Plugin for TAR SWGS.
 import os
 import csv
 from djerba.plugins.base import plugin_base
-from mako.lookup import TemplateLookup
 import djerba.plugins.tar.swgs.constants as constants
 from djerba.plugins.tar.swgs.preprocess import preprocess
 from djerba.plugins.tar.swgs.extract import data_builder 
 import djerba.core.constants as core_constants
-import gsiqcetl.column
-from gsiqcetl import QCETLCache
 from djerba.util.render_mako import mako_renderer
 from djerba.mergers.gene_information_merger.factory import factory as gim_factory
 from djerba.mergers.treatment_options_merger.factory import factory as tom_factory
@@ -155,7 +152,8 @@ class main(plugin_base):
           reader = csv.DictReader(input_file, delimiter="\t")
           for row_input in reader:
               # record the gene for all reportable alterations
-              level = oncokb_levels.parse_oncokb_level(row_input)
+              # level and therapies are parsed in one pass over the row
+              level, therapies = oncokb_levels.parse_level_and_therapies(row_input)
               if level not in ['Unknown', 'NA']:
                   gene = row_input[constants.HUGO_SYMBOL_UPPER_CASE]
                   gene_info_entry = gene_info_factory.get_json(
@@ -163,7 +161,6 @@ class main(plugin_base):
                       summary=summaries.get(gene)
                   )
                   gene_info.append(gene_info_entry)
-              therapies = oncokb_levels.parse_actionable_therapies(row_input)
               # record therapy for all actionable alterations (OncoKB level 4 or higher)
               # row may contain therapies at multiple OncoKB levels
               for level in therapies.keys():
@@ -4,14 +4,15 @@ AUTHOR: Felix Beaudry
 """
 
 import csv
-import json
 import logging
 import os
+import pandas
 import re
 import tempfile
 import zipfile
 
 import djerba.plugins.wgts.cnv_purple.constants as pc
+from djerba.core.workspace import json_dumps
 from djerba.util.logger import logger
 from djerba.util.subprocess_runner import subprocess_runner
 from djerba.util.environment import directory_finder
@@ -156,20 +157,21 @@ class purple_processor(logger):
             -1: "Shallow Deletion",
             -2: "Deep Deletion"
         }
-        states = {}
-        with open(os.path.join(self.work_dir, 'purple.data_CNA.txt')) as in_file:
-            reader = csv.DictReader(in_file, delimiter="\t")
-            for row in reader:
-                gene = row['Hugo_Symbol']
-                try:
-                    cna = int(row[tumour_id])
-                    states[gene] = conversion[cna]
-                except (TypeError, KeyError) as err:
-                    msg = "Cannot convert unknown CNA code: {0}".format(row[1])
-                    self.logger.error(msg)
-                    raise RuntimeError(msg) from err
+        # read the two wanted columns and map CNA codes to states at C level
+        cna_table = pandas.read_csv(
+            os.path.join(self.work_dir, 'purple.data_CNA.txt'),
+            delimiter="\t",
+            usecols=['Hugo_Symbol', tumour_id]
+        )
+        mapped = cna_table[tumour_id].map(conversion)
+        if mapped.isna().any():
+            code = cna_table[tumour_id][mapped.isna()].iloc[0]
+            msg = "Cannot convert unknown CNA code: {0}".format(code)
+            self.logger.error(msg)
+            raise RuntimeError(msg)
+        states = dict(zip(cna_table['Hugo_Symbol'], mapped.tolist()))
         with open(os.path.join(self.work_dir, self.COPY_STATE_FILE), 'w') as out_file:
-            out_file.write(json.dumps(states, sort_keys=True, indent=4))
+            out_file.write(json_dumps(states))
 
     def write_purple_alternate_launcher(self, path_info):
         bam_files = path_info.get(pc.BMPP)
@@ -3,14 +3,15 @@ Supporting tools for the CNV plugin
 """
 
 import csv
-import json
 import logging
 import os
+import pandas
 import djerba.core.constants as core_constants
 import djerba.plugins.wgts.common.cnv.constants as cnv
 import djerba.util.oncokb.constants as oncokb_constants
 from djerba.mergers.gene_information_merger.factory import factory as gim_factory
 from djerba.mergers.treatment_options_merger.factory import factory as tom_factory
+from djerba.core.workspace import json_dumps
 from djerba.plugins.wgts.common.tools import wgts_tools
 from djerba.util.sequenza import sequenza_reader 
 from djerba.util.environment import directory_finder
@@ -42,20 +43,25 @@ class cnv_processor(logger):
         self.config = config_wrapper
         self.plot_path = os.path.join(self.work_dir, self.PLOT_FILENAME)
         self.seg_path = os.path.join(self.work_dir, self.SEG_FILENAME)
-        self.data_dir = directory_finder(log_level, log_path).get_data_dir()        
+        self.data_dir = directory_finder(log_level, log_path).get_data_dir()
+        self.annotated_rows = None # cached parse of the annotated CNA file
 
     def calculate_percent_genome_altered(self):
-        total = 0
         if not os.path.exists(self.seg_path):
             msg = "Cannot compute percent genome altered before "+\
                 "generating SEG file: {0}".format(self.seg_path)
             self.logger.error(msg)
             raise RuntimeError(msg)
-        with open(self.seg_path) as input_file:
-            for row in csv.DictReader(input_file, delimiter="\t"):
-                seg_mean = row['seg.mean']
-                if seg_mean != 'NA' and abs(float(seg_mean)) >= self.MINIMUM_MAGNITUDE_SEG_MEAN:
-                    total += int(row['loc.end']) - int(row['loc.start'])
+        # read the segment columns as arrays and compute with vector operations;
+        # 'NA' seg.mean values become NaN, which fail the magnitude test as before
+        seg = pandas.read_csv(
+            self.seg_path,
+            delimiter="\t",
+            usecols=['loc.start', 'loc.end', 'seg.mean'],
+            na_values=['NA']
+        )
+        altered = seg['seg.mean'].abs() >= self.MINIMUM_MAGNITUDE_SEG_MEAN
+        total = int((seg['loc.end'][altered] - seg['loc.start'][altered]).sum())
         # TODO see GCGI-347 for possible updates to genome size
         fga = float(total)/self.GENOME_SIZE
         return int(round(fga*100, 0))
@@ -71,34 +77,31 @@ class cnv_processor(logger):
         summaries = gene_summary_reader(self.log_level, self.log_path)
         treatments = []
         treatment_option_factory = tom_factory(self.log_level, self.log_path)
-        input_name = oncokb_constants.DATA_CNA_ONCOKB_GENES_NON_DIPLOID_ANNOTATED
         oncotree_code = self.config.get_my_string(cnv.ONCOTREE_CODE)
-        with open(os.path.join(self.work_dir, input_name)) as input_file:
-            reader = csv.DictReader(input_file, delimiter="\t")
-            for row_input in reader:
-                # record the gene for all reportable alterations
-                level = oncokb_levels.parse_oncokb_level(row_input)
-                if level not in ['N3', 'N4', 'Unknown', 'NA']:
-                    gene = row_input[self.HUGO_SYMBOL_UPPER_CASE]
-                    gene_info_entry = gene_info_factory.get_json(
-                        gene=gene,
-                        summary=summaries.get(gene)
-                    )
-                    gene_info.append(gene_info_entry)
-                # record therapy for all actionable alterations (OncoKB level 4 or higher)
-                therapies = oncokb_levels.parse_actionable_therapies(row_input)
-                for level in therapies.keys():
-                    alt = row_input['ALTERATION']
-                    alt_url = html_builder.build_alteration_url(gene, alt, oncotree_code)
-                    treatment_entry = treatment_option_factory.get_json(
-                        tier = oncokb_levels.tier(level),
-                        level = level,
-                        gene = gene,
-                        alteration = alt,
-                        alteration_url = alt_url,
-                        treatments = therapies[level]
-                    )
-                    treatments.append(treatment_entry)
+        for row_input in self.read_annotated_rows():
+            # record the gene for all reportable alterations
+            level = row_input[core_constants.ONCOKB]
+            if level not in ['N3', 'N4', 'Unknown', 'NA']:
+                gene = row_input[self.HUGO_SYMBOL_UPPER_CASE]
+                gene_info_entry = gene_info_factory.get_json(
+                    gene=gene,
+                    summary=summaries.get(gene)
+                )
+                gene_info.append(gene_info_entry)
+            # record therapy for all actionable alterations (OncoKB level 4 or higher)
+            therapies = oncokb_levels.parse_actionable_therapies(row_input)
+            for level in therapies.keys():
+                alt = row_input['ALTERATION']
+                alt_url = html_builder.build_alteration_url(gene, alt, oncotree_code)
+                treatment_entry = treatment_option_factory.get_json(
+                    tier = oncokb_levels.tier(level),
+                    level = level,
+                    gene = gene,
+                    alteration = alt,
+                    alteration_url = alt_url,
+                    treatments = therapies[level]
+                )
+                treatments.append(treatment_entry)
         # assemble the output
         merge_inputs = {
             'gene_information_merger': gene_info,
@@ -120,21 +123,18 @@ class cnv_processor(logger):
             self.logger.info("No expression data found")
             mutation_expression = {}
         cytobands = wgts_tools(self.log_level, self.log_path).cytoband_lookup()
-        input_name = oncokb_constants.DATA_CNA_ONCOKB_GENES_NON_DIPLOID_ANNOTATED
-        with open(os.path.join(self.work_dir, input_name)) as input_file:
-            reader = csv.DictReader(input_file, delimiter="\t")
-            for row_input in reader:
-                gene = row_input[self.HUGO_SYMBOL_UPPER_CASE]
-                # if gene not found in cytoBands.txt, default to 'Unknown'
-                row_output = {
-                    cnv.EXPRESSION_PERCENTILE: mutation_expression.get(gene), # None for WGS
-                    wgts_tools.GENE: gene,
-                    cnv.GENE_URL: html_builder.build_gene_url(gene),
-                    cnv.ALTERATION: row_input[self.ALTERATION_UPPER_CASE],
-                    wgts_tools.CHROMOSOME: cytobands.get(gene, wgts_tools.UNKNOWN),
-                    wgts_tools.ONCOKB: oncokb_levels.parse_oncokb_level(row_input)
-                }
-                rows.append(row_output)
+        for row_input in self.read_annotated_rows():
+            gene = row_input[self.HUGO_SYMBOL_UPPER_CASE]
+            # if gene not found in cytoBands.txt, default to 'Unknown'
+            row_output = {
+                cnv.EXPRESSION_PERCENTILE: mutation_expression.get(gene), # None for WGS
+                wgts_tools.GENE: gene,
+                cnv.GENE_URL: html_builder.build_gene_url(gene),
+                cnv.ALTERATION: row_input[self.ALTERATION_UPPER_CASE],
+                wgts_tools.CHROMOSOME: cytobands.get(gene, wgts_tools.UNKNOWN),
+                wgts_tools.ONCOKB: row_input[core_constants.ONCOKB]
+            }
+            rows.append(row_output)
         unfiltered_cnv_total = len(rows)
         self.logger.debug("Sorting and filtering CNV rows")
         rows = wgts_toolkit.sort_variant_rows(rows)
@@ -149,6 +149,28 @@ class cnv_processor(logger):
         }
         return results
 
+    def read_annotated_rows(self):
+        """
+        Parse the annotated CNA file into a list of row dicts
+        Parsed once and cached; both the results table and the merge inputs
+        are derived from the same file
+        OncoKB levels are parsed for all rows at once and stored per row
+        """
+        if self.annotated_rows is None:
+            input_name = oncokb_constants.DATA_CNA_ONCOKB_GENES_NON_DIPLOID_ANNOTATED
+            data = pandas.read_csv(
+                os.path.join(self.work_dir, input_name),
+                delimiter="\t",
+                dtype=str,
+                keep_default_na=False
+            )
+            rows = data.to_dict(orient='records')
+            parsed_levels = oncokb_levels.parse_oncokb_level_column(data)
+            for row, level in zip(rows, parsed_levels):
+                row[core_constants.ONCOKB] = level
+            self.annotated_rows = rows
+        return self.annotated_rows
+
     def run_main_r_script(self):
         """Run the main process_CNA_data.R script"""
         r_script_dir = os.path.join(os.path.dirname(__file__), 'R')
@@ -197,21 +219,22 @@ class cnv_processor(logger):
             -1: "Shallow Deletion",
             -2: "Deep Deletion"
         }
-        states = {}
-        with open(os.path.join(self.work_dir, 'data_CNA.txt')) as in_file:
-            reader = csv.reader(in_file, delimiter="\t")
-            for row in reader:
-                if row[0]!='Hugo_Symbol':
-                    gene = row[0]
-                    try:
-                        cna = int(row[1])
-                        states[gene] = conversion[cna]
-                    except (TypeError, KeyError) as err:
-                        msg = "Cannot convert unknown CNA code: {0}".format(row[1])
-                        self.logger.error(msg)
-                        raise RuntimeError(msg) from err
+        # read the two wanted columns and map CNA codes to states at C level;
+        # data_CNA.txt has one row per gene
+        cna_table = pandas.read_csv(
+            os.path.join(self.work_dir, 'data_CNA.txt'),
+            delimiter="\t",
+            usecols=[0, 1]
+        )
+        mapped = cna_table.iloc[:, 1].map(conversion)
+        if mapped.isna().any():
+            code = cna_table.iloc[:, 1][mapped.isna()].iloc[0]
+            msg = "Cannot convert unknown CNA code: {0}".format(code)
+            self.logger.error(msg)
+            raise RuntimeError(msg)
+        states = dict(zip(cna_table.iloc[:, 0], mapped.tolist()))
         with open(os.path.join(self.work_dir, cnv.COPY_STATE_FILE), 'w') as out_file:
-            out_file.write(json.dumps(states, sort_keys=True, indent=4))
+            out_file.write(json_dumps(states))
 
     def write_working_files(self):
         """
@@ -223,7 +246,8 @@ class cnv_processor(logger):
         gamma = self.config.get_my_int(cnv.SEQUENZA_GAMMA)
         sequenza_path = self.config.get_my_string(cnv.SEQUENZA_PATH)
         in_path = sequenza_reader(sequenza_path).extract_cn_seg_file(self.work_dir, gamma)
-        with open(in_path, 'rt') as in_file, open(self.seg_path, 'wt') as out_file:
+        with open(in_path, 'rt', newline='') as in_file, \
+             open(self.seg_path, 'wt', newline='') as out_file:
             reader = csv.reader(in_file, delimiter="\t")
             writer = csv.writer(out_file, delimiter="\t")
             in_header = True
@@ -56,6 +56,7 @@ class snv_indel_processor(logger):
         self.work_dir = workspace.get_work_dir()
         self.config = config_wrapper
         self.data_dir = directory_finder(log_level, log_path).get_data_dir()
+        self.oncogenic_rows = None # cached parse of the annotated oncogenic file
 
     def _maf_body_row_ok(self, row, ix, vaf_cutoff):
         """
@@ -89,12 +90,9 @@ class snv_indel_processor(logger):
         return ok
 
     def _read_maf_indices(self, row):
-        indices = {}
-        for i in range(len(row)):
-            key = row[i]
-            if key in sic.MAF_KEYS:
-                indices[key] = i
-        if set(indices.keys()) != set(sic.MAF_KEYS):
+        wanted = set(sic.MAF_KEYS)
+        indices = {key: i for i, key in enumerate(row) if key in wanted}
+        if set(indices.keys()) != wanted:
             msg = "Indices found in MAF header {0} ".format(indices.keys()) +\
                     "do not match required keys {0}".format(sic.MAF_KEYS)
             self.logger.error(msg)
@@ -123,54 +121,51 @@ class snv_indel_processor(logger):
         Read gene and therapy information for merge inputs
         Both are derived from the annotated mutations file
         """
-        # read the tab-delimited input file
         gene_info = []
         gene_info_factory = gim_factory(self.log_level, self.log_path)
         summaries = gene_summary_reader(self.log_level, self.log_path)
         treatments = []
         treatment_option_factory = tom_factory(self.log_level, self.log_path)
         oncotree_code = self.config.get_my_string(sic.ONCOTREE_CODE)
-        with open(os.path.join(self.work_dir, sic.MUTATIONS_ONCOGENIC)) as input_file:
-            reader = csv.DictReader(input_file, delimiter="\t")
-            for row_input in reader:
-                # record the gene for all reportable alterations
-                level = oncokb_levels.parse_oncokb_level(row_input)
-                if level not in ['Unknown', 'NA']:
-                    gene = row_input[sic.HUGO_SYMBOL]
-                    gene_info_entry = gene_info_factory.get_json(
-                        gene=gene,
-                        summary=summaries.get(gene)
-                    )
-                    gene_info.append(gene_info_entry)
-                therapies = oncokb_levels.parse_actionable_therapies(row_input)
-                # record therapy for all actionable alterations (OncoKB level 4 or higher)
-                # row may contain therapies at multiple OncoKB levels
-                for level in therapies.keys():
-                    alt = row_input[sic.HGVSP_SHORT]
-                    if gene == 'BRAF' and alt == 'p.V640E':
-                        alt = 'p.V600E'
-                    alt_url = html_builder.build_alteration_url(gene, alt, oncotree_code)
-                    if 'splice' in row_input[sic.VARIANT_CLASSIFICATION].lower():
-                        alt = 'p.? (' + row_input[sic.HGVSC] + ')'
-                        alt_url = html_builder.build_alteration_url(gene, "Truncating%20Mutations", oncotree_code)
-                    if gene == 'TERT':
-                        # filtering for TERT hot spot would have already occured so this is a hot spot
-                        if row_input[sic.START] == '1295113':
-                            alt = 'p.? (c.-124C>T)'
-                        elif row_input[sic.START] == '1295135':
-                            alt = 'p.? (c.-146C>T)'
-                        alt_url = html_builder.build_alteration_url(
-                            gene, "Promoter%20Mutation", oncotree_code
-                        )
-                    treatment_entry = treatment_option_factory.get_json(
-                        tier = oncokb_levels.tier(level),
-                        level = level,
-                        gene = gene,
-                        alteration = alt,
-                        alteration_url = alt_url,
-                        treatments = therapies[level]
+        for row_input in self.read_oncogenic_rows():
+            # record the gene for all reportable alterations
+            level = row_input[core_constants.ONCOKB]
+            if level not in ['Unknown', 'NA']:
+                gene = row_input[sic.HUGO_SYMBOL]
+                gene_info_entry = gene_info_factory.get_json(
+                    gene=gene,
+                    summary=summaries.get(gene)
+                )
+                gene_info.append(gene_info_entry)
+            therapies = oncokb_levels.parse_actionable_therapies(row_input)
+            # record therapy for all actionable alterations (OncoKB level 4 or higher)
+            # row may contain therapies at multiple OncoKB levels
+            for level in therapies.keys():
+                alt = row_input[sic.HGVSP_SHORT]
+                if gene == 'BRAF' and alt == 'p.V640E':
+                    alt = 'p.V600E'
+                alt_url = html_builder.build_alteration_url(gene, alt, oncotree_code)
+                if 'splice' in row_input[sic.VARIANT_CLASSIFICATION].lower():
+                    alt = 'p.? (' + row_input[sic.HGVSC] + ')'
+                    alt_url = html_builder.build_alteration_url(gene, "Truncating%20Mutations", oncotree_code)
+                if gene == 'TERT':
+                    # filtering for TERT hot spot would have already occured so this is a hot spot
+                    if row_input[sic.START] == '1295113':
+                        alt = 'p.? (c.-124C>T)'
+                    elif row_input[sic.START] == '1295135':
+                        alt = 'p.? (c.-146C>T)'
+                    alt_url = html_builder.build_alteration_url(
+                        gene, "Promoter%20Mutation", oncotree_code
                     )
-                    treatments.append(treatment_entry)
+                treatment_entry = treatment_option_factory.get_json(
+                    tier = oncokb_levels.tier(level),
+                    level = level,
+                    gene = gene,
+                    alteration = alt,
+                    alteration_url = alt_url,
+                    treatments = therapies[level]
+                )
+                treatments.append(treatment_entry)
         # assemble the output
         merge_inputs = {
             'gene_information_merger': gene_info,
@@ -189,13 +184,16 @@ class snv_indel_processor(logger):
         # Splice_Region mutations are of interest, but excluded from standard TMB definition
         # The TMB mutation count is (independently) implemented and used in vaf_plot.R
         # See JIRA ticket GCGI-496
-        total = 0
-        excluded = 0
-        with open(os.path.join(self.work_dir, sic.MUTATIONS_ALL)) as data_file:
-            for row in csv.DictReader(data_file, delimiter="\t"):
-                total += 1
-                if row.get(sic.VARIANT_CLASSIFICATION) in sic.TMB_EXCLUDED:
-                    excluded += 1
+        # columnar read of the classification column; counting at C level
+        classifications = pd.read_csv(
+            os.path.join(self.work_dir, sic.MUTATIONS_ALL),
+            sep="\t",
+            usecols=[sic.VARIANT_CLASSIFICATION],
+            dtype=str,
+            keep_default_na=False
+        )[sic.VARIANT_CLASSIFICATION]
+        total = len(classifications)
+        excluded = int(classifications.isin(sic.TMB_EXCLUDED).sum())
         coding_total = total - excluded
         msg = "Found {} small mutations and indels, ".format(total)+\
             "of which {} are coding mutations".format(coding_total)
@@ -230,25 +228,23 @@ class snv_indel_processor(logger):
         else:
             has_loh = False
             loh_dict = {}
-        with open(os.path.join(self.work_dir, sic.MUTATIONS_ONCOGENIC)) as input_file:
-            reader = csv.DictReader(input_file, delimiter="\t")
-            for row_input in reader:
-                gene = row_input[sic.HUGO_SYMBOL]
-                [protein, protein_url] = self.get_protein_info(row_input, oncotree_code)
-                row_output = {
-                    wgts_tools.EXPRESSION_PERCENTILE: expression.get(gene), # None for WGS
-                    wgts_tools.GENE: gene,
-                    wgts_tools.GENE_URL: html_builder.build_gene_url(gene),
-                    sic.PROTEIN: protein,
-                    sic.PROTEIN_URL: protein_url,
-                    sic.TYPE: self.get_mutation_type(row_input),
-                    sic.VAF: self.get_tumour_vaf(row_input),
-                    sic.DEPTH: self.get_mutation_depth(row_input),
-                    sic.LOH: loh_dict.get(gene), # None of LOH not available
-                    wgts_tools.CHROMOSOME: cytobands.get(gene, wgts_tools.UNKNOWN),
-                    wgts_tools.ONCOKB: oncokb_levels.parse_oncokb_level(row_input)
-                }
-                rows.append(row_output)
+        for row_input in self.read_oncogenic_rows():
+            gene = row_input[sic.HUGO_SYMBOL]
+            [protein, protein_url] = self.get_protein_info(row_input, oncotree_code)
+            row_output = {
+                wgts_tools.EXPRESSION_PERCENTILE: expression.get(gene), # None for WGS
+                wgts_tools.GENE: gene,
+                wgts_tools.GENE_URL: html_builder.build_gene_url(gene),
+                sic.PROTEIN: protein,
+                sic.PROTEIN_URL: protein_url,
+                sic.TYPE: self.get_mutation_type(row_input),
+                sic.VAF: self.get_tumour_vaf(row_input),
+                sic.DEPTH: self.get_mutation_depth(row_input),
+                sic.LOH: loh_dict.get(gene), # None of LOH not available
+                wgts_tools.CHROMOSOME: cytobands.get(gene, wgts_tools.UNKNOWN),
+                wgts_tools.ONCOKB: row_input[core_constants.ONCOKB]
+            }
+            rows.append(row_output)
         rows = wgts_toolkit.sort_variant_rows(rows)
         rows = oncokb_levels.filter_reportable(rows)
         somatic_total, coding_seq_total = self.get_mutation_totals()
@@ -319,6 +315,23 @@ class snv_indel_processor(logger):
         else:
             return False
 
+    def read_oncogenic_rows(self):
+        """
+        Parse the annotated oncogenic mutations file into a list of row dicts
+        Parsed once and cached; both the results table and the merge inputs
+        are derived from the same file
+        OncoKB levels are parsed for all rows at once and stored per row
+        """
+        if self.oncogenic_rows is None:
+            in_path = os.path.join(self.work_dir, sic.MUTATIONS_ONCOGENIC)
+            data = pd.read_csv(in_path, sep="\t", dtype=str, keep_default_na=False)
+            rows = data.to_dict(orient='records')
+            parsed_levels = oncokb_levels.parse_oncokb_level_column(data)
+            for row, level in zip(rows, parsed_levels):
+                row[core_constants.ONCOKB] = level
+            self.oncogenic_rows = rows
+        return self.oncogenic_rows
+
     def preprocess_maf(self, maf_path, tumour_id):
         """Filter a MAF file to remove unwanted rows; also update the tumour ID"""
         tmp_path = os.path.join(self.work_dir, 'filtered_maf.tsv')
@@ -326,8 +339,8 @@ class snv_indel_processor(logger):
         self.logger.info("Filtering MAF input")
         # find the relevant indices on-the-fly from MAF column headers
         # use this instead of csv.DictReader to preserve the rows for output
-        with gzip.open(maf_path, 'rt', encoding=core_constants.TEXT_ENCODING) as in_file,\
-             open(tmp_path, 'wt') as tmp_file:
+        with gzip.open(maf_path, 'rt', encoding=core_constants.TEXT_ENCODING, newline='') as in_file,\
+             open(tmp_path, 'wt', newline='') as tmp_file:
             # preprocess the MAF file
             reader = csv.reader(in_file, delimiter="\t")
             writer = csv.writer(tmp_file, delimiter="\t")
@@ -396,18 +409,15 @@ class snv_indel_processor(logger):
     def whizbam_to_text(self, in_name, out_name):
         in_path = os.path.join(self.work_dir, in_name)
         out_path = os.path.join(self.work_dir, out_name)
-        links = []
-        with open(in_path) as in_file, open(out_path, 'w') as out_file:
-            reader = csv.DictReader(in_file, delimiter="\t")
-            writer = csv.DictWriter(
-                out_file,
-                fieldnames=['Hugo_Symbol', 'whizbam'],
-                extrasaction='ignore',
-                delimiter="\t"
-            )
-            writer.writeheader()
-            for row in reader:
-                writer.writerow(row)
+        # read only the two wanted columns; avoids a dict per 100+ column row
+        links = pd.read_csv(
+            in_path,
+            sep="\t",
+            usecols=['Hugo_Symbol', 'whizbam'],
+            dtype=str,
+            keep_default_na=False
+        )
+        links[['Hugo_Symbol', 'whizbam']].to_csv(out_path, sep="\t", index=False)
 
     def write_whizbam_files(self):
         """
@@ -15,6 +15,7 @@ import djerba.core.constants as core_constants
 import djerba.util.constants as constants
 import djerba.util.ini_fields as ini
 
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from copy import deepcopy
 from glob import glob
@@ -145,9 +146,13 @@ class benchmarker(logger):
             sample_inputs[self.UPDATE_CACHE] = self.args.update_cache
             for key in [self.TUMOUR_ID, self.NORMAL_ID, self.PURITY]:
                 sample_inputs[key] = self.sample_params[sample][key]
-            for key in templates.keys():
-                pattern = templates[key].format(results_dir, sample)
-                sample_inputs[key] = self.glob_single(pattern)
+            # the recursive globs are independent and I/O-bound, so run them in
+            # parallel threads; results are assigned by key, preserving determinism
+            keys = list(templates.keys())
+            patterns = [templates[key].format(results_dir, sample) for key in keys]
+            with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+                for key, result in zip(keys, executor.map(self.glob_single, patterns)):
+                    sample_inputs[key] = result
             # Workaround for placeholder arriba output
             if sample_inputs[self.ARRIBA_FILE] == None:
                 arriba_path = os.path.join(self.private_dir, 'arriba', 'arriba.fusions.tsv')
@@ -1,23 +1,33 @@
 """Simple utility functions for time/date"""
 
+import functools
+import re
 import time
+from datetime import date
 
 DATE_FORMAT = "%Y-%m-%d"
 TIMESTAMP_FORMAT = '%Y-%m-%d_%H:%M:%S %z'
+# guard for fromisoformat, which would otherwise accept eg. YYYYMMDD
+DATE_REGEX = re.compile(r'\d{4}-\d{2}-\d{2}')
 
 def get_timestamp():
     return time.strftime(TIMESTAMP_FORMAT, time.localtime())
 
 def get_todays_date():
-    return time.strftime(DATE_FORMAT)
+    # same YYYY-MM-DD output as strftime, without format-string parsing
+    return date.today().isoformat()
 
+@functools.lru_cache(maxsize=1024)
 def is_valid_date(date_string):
-    valid = True
+    # cached; the same date string is often validated many times per run
+    # fromisoformat is a direct C parser, far faster than strptime
+    if not DATE_REGEX.fullmatch(date_string):
+        return False
     try:
-        time.strptime(date_string, DATE_FORMAT)
+        date.fromisoformat(date_string)
     except ValueError:
-        valid = False
-    return valid
+        return False
+    return True
 
 class DjerbaDateFormatError(Exception):
     pass
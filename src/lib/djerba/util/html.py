@@ -17,7 +17,10 @@ class html_builder:
 
     @staticmethod
     def build_alteration_url(gene, alteration, cancer_code):
-        return '/'.join([html_builder.ONCOKB_URL_PREFIX, gene, alteration, cancer_code])
+        # one C-level format call, no intermediate list; runs once per variant
+        return '{0}/{1}/{2}/{3}'.format(
+            html_builder.ONCOKB_URL_PREFIX, gene, alteration, cancer_code
+        )
 
     @staticmethod
     def build_fusion_url(genes, oncotree_code):
@@ -119,7 +122,7 @@ class html_builder:
     def td_oncokb(level):
         # make a table cell with an OncoKB level symbol
         # permitted levels must have a format defined in style.css
-        level = re.sub('Level ', '', level) # strip off 'Level ' prefix, if any
+        level = level.replace('Level ', '') # strip off 'Level ' prefix, if any
         div = oncokb_levels.oncokb_level_to_html(level)
         return html_builder.td(div)
 
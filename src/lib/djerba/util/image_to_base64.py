@@ -2,7 +2,8 @@
 
 import base64
 import logging
-import re
+import mmap
+import os
 import djerba.util.constants as constants
 from djerba.util.logger import logger
 from djerba.util.validator import path_validator
@@ -25,8 +26,14 @@ class converter(logger):
             self.logger.error(msg)
             raise RuntimeError(msg)
         if self.is_convertible(image_input, description):
-            with open(image_input, 'rb') as image_file:
-                image_string = base64.b64encode(image_file.read()).decode(constants.TEXT_ENCODING)
+            if os.path.getsize(image_input) > 0:
+                # encode straight from the file buffer via mmap; skips an
+                # intermediate full copy of the raw image bytes
+                with open(image_input, 'rb') as image_file:
+                    with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+                        image_string = base64.b64encode(image_map).decode(constants.TEXT_ENCODING)
+            else:
+                image_string = '' # mmap cannot map an empty file
             image_json = 'data:image/{0};base64,{1}'.format(image_type, image_string)
             msg = "Converted {0} {1} {2} to base64".format(image_type, description, image_input)
             self.logger.debug(msg)
@@ -49,7 +56,7 @@ class converter(logger):
     def is_convertible(self, arg, description=DEFAULT_DESC):
         """Argument may be a path or already a base64 blob; check if it can be converted to base64"""
         convertible = True
-        if re.match('data:image', arg):
+        if arg.startswith('data:image'):
             self.logger.debug(description+" is already encoded; invalid for base64 conversion")
             convertible = False
         elif not self.validator.validate_input_file(arg):
@@ -1,5 +1,7 @@
 """Field names for the input INI file"""
 
+import sys
+
 # section names
 INPUTS = 'inputs'
 SETTINGS = 'settings'
@@ -421,3 +423,11 @@ SCHEMA_FAILED = {
         MAVIS_LINK
    ]
 }
+
+# intern every field constant at import time; the values are used as dict and
+# ConfigParser keys throughout the pipeline, and interned keys let lookups
+# short-circuit on pointer equality before any character comparison
+for _name, _value in list(globals().items()):
+    if _name.isupper() and isinstance(_value, str):
+        globals()[_name] = sys.intern(_value)
+del _name, _value
@@ -1,6 +1,5 @@
 """Main class for mini-Djerba"""
 
-import json
 import logging
 import os
 import djerba.core.constants as cc
@@ -8,6 +7,7 @@ import djerba.util.mini.constants as constants
 from configparser import ConfigParser
 from time import strftime
 from djerba.core.main import main_base
+from djerba.core.workspace import json_dumps, json_loads
 from djerba.plugins.patient_info.plugin import main as patient_info_plugin
 from djerba.plugins.summary.plugin import main as summary_plugin
 from djerba.plugins.supplement.body.plugin import main as supplement_plugin
@@ -70,7 +70,7 @@ class main(main_base):
         Update is carried out using the HTML cache in JSON
         """
         with open(json_path) as in_file:
-            data = json.loads(in_file.read())
+            data = json_loads(in_file.read())
         doc_key = self._get_unique_doc_key(data)
         if ini_path or summary_path:
             # update data for the given parameters
@@ -113,7 +113,7 @@ class main(main_base):
             out_name = "{0}.updated.json".format(data[cc.CORE][cc.REPORT_ID])
             out_path = os.path.join(out_dir, out_name)
             with open(out_path, 'w', encoding=cc.TEXT_ENCODING) as out_file:
-                out_file.write(json.dumps(data))
+                out_file.write(json_dumps(data))
             self.logger.debug('Wrote updated JSON data to {0}'.format(out_path))
         else:
             self.logger.debug('No additional config given, rendering existing JSON')
@@ -129,7 +129,7 @@ class main(main_base):
         write_summary = True
         if json_path:
             with open(json_path, encoding=cc.TEXT_ENCODING) as in_file:
-                data = json.loads(in_file.read())
+                data = json_loads(in_file.read())
             patient_info = data[cc.PLUGINS][self.PATIENT_INFO][cc.RESULTS]
             supplement = data[cc.PLUGINS][self.SUPPLEMENT][cc.RESULTS]
             self.logger.debug("Supplement: {0}".format(supplement))
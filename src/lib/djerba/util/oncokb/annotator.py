@@ -95,6 +95,18 @@ class oncokb_annotator(logger):
         self.apply_cache = cache_params.get_apply_cache()
         self.update_cache = cache_params.get_update_cache()
 
+    def _count_lines(self, in_path):
+        """Count lines by buffered byte reads, without building a list of lines"""
+        total = 0
+        last_chunk = b'\n'
+        with open(in_path, 'rb') as in_file:
+            for chunk in iter(lambda: in_file.read(1048576), b''):
+                total += chunk.count(b'\n')
+                last_chunk = chunk
+        if not last_chunk.endswith(b'\n'):
+            total += 1 # count a final line with no trailing newline
+        return total
+
     def _run_annotator_script(self, command, description):
         """Redact the OncoKB token (-b argument) from logging"""
         self.runner.run(command, description, ['-b',])
@@ -122,8 +134,7 @@ class oncokb_annotator(logger):
         in_path = os.path.join(self.report_dir, constants.DATA_FUSIONS_ONCOKB)
         self.validator.validate_input_file(in_path)
         out_path = os.path.join(self.report_dir, oncokb_constants.DATA_FUSIONS_ONCOKB_ANNOTATED)
-        with open(in_path) as in_file:
-            total = len(in_file.readlines())
+        total = self._count_lines(in_path)
         if self.apply_cache:
             self.cache.annotate_fusion(in_path, out_path)
         elif total == 0:
@@ -7,10 +7,9 @@
 import csv
 import gzip
 import hashlib
-import json
 import logging
 import os
-import re
+from djerba.core.workspace import json_dumps, json_loads
 from djerba.util.logger import logger
 from djerba.util.validator import path_validator
 import djerba.util.oncokb.constants as oncokb_constants
@@ -90,7 +89,7 @@ class oncokb_cache(logger):
     def _initialize_cache(self, cache_input):
         if cache_input:
             with open(cache_input) as cache_file:
-                cache = json.loads(cache_file.read())
+                cache = json_loads(cache_file.read())
                 msg = "Read {0} annotations from cache file {1}".format(len(cache), cache_input)
                 self.logger.debug(msg)
         else:
@@ -99,18 +98,21 @@ class oncokb_cache(logger):
         return cache
 
     def _make_maf_key(self, row, boundary):
-        base = re.sub("[\r\n]", "", "\t".join(row[0:boundary]))
+        # literal replacements; called once per MAF row, so no regex
+        base = "\t".join(row[0:boundary]).replace("\r", "").replace("\n", "")
         return hashlib.sha256(base.encode(constants.TEXT_ENCODING)).hexdigest()
 
     def _open_maybe_gzip(self, input_path):
-        if re.search('\.gz$', input_path):
-            return gzip.open(input_path, 'rt')
+        # newline='' skips universal-newline translation; the csv module
+        # handles line endings itself, and MAF-scale files are read here
+        if input_path.endswith('.gz'):
+            return gzip.open(input_path, 'rt', newline='')
         else:
-            return open(input_path)
+            return open(input_path, newline='', buffering=1048576)
 
     def _read_oncokb_info(self, info_path):
         rows = 0
-        with open(info_path) as info_file:
+        with open(info_path, newline='') as info_file:
             reader = csv.DictReader(info_file, delimiter="\t")
             for row in reader:
                 sample = row.get('SAMPLE_ID')
@@ -124,7 +126,7 @@ class oncokb_cache(logger):
 
     def _write_cache(self, cache, cache_output):
         with open(cache_output, 'w') as cache_file:
-            cache_file.write(json.dumps(cache))
+            cache_file.write(json_dumps(cache))
         msg = "Wrote {0} annotations to cache file {1}".format(len(cache), cache_output)
         self.logger.debug(msg)
 
@@ -138,10 +140,10 @@ class oncokb_cache(logger):
         msg = "Annotating CNA from cache: "+\
               "Input {0}, output {1}, metadata {2}".format(input_cna, output_cna, oncokb_info)
         self.logger.debug(msg)
-        with open(self.cna_cache) as cache_file:
-            cache = json.loads(cache_file.read())
+        with open(self.cna_cache, newline='') as cache_file:
+            cache = json_loads(cache_file.read())
         cna_keys = []
-        with open(input_cna) as input_file:
+        with open(input_cna, newline='') as input_file:
             reader = csv.reader(input_file, delimiter="\t")
             first = True
             for row in reader:
@@ -205,7 +207,7 @@ class oncokb_cache(logger):
         """
         self.validator.validate_input_file(cache_path)
         with open(cache_path) as cache_file:
-            cache = json.loads(cache_file.read())
+            cache = json_loads(cache_file.read())
         reads_from_cache = 0
         total_reads = 0
         annotated_rows = []
@@ -250,15 +252,17 @@ class oncokb_cache(logger):
             cna: self.cna_cache,
             fusion: self.fusion_cache
         }
-        for input_path in inputs.values():
-            if not os.path.exists(input_path):
-                msg = "Input file {0} does not exist; ".format(input_path)+\
-                      "need to generate report with --no-cleanup option?"
-                self.logger.error(msg)
-                raise RuntimeError(msg)
+        missing = [x for x in inputs.values() if not os.path.exists(x)]
+        if missing:
+            msg = "Input file(s) {0} do not exist; ".format(missing)+\
+                  "need to generate report with --no-cleanup option?"
+            self.logger.error(msg)
+            raise RuntimeError(msg)
+        # one scandir call instead of a stat for each candidate cache file
+        cache_dir_names = {entry.name for entry in os.scandir(self.cache_dir)}
         existing = {} # existing cache files, if any
         for key in outputs.keys():
-            if os.path.exists(outputs[key]):
+            if os.path.basename(outputs[key]) in cache_dir_names:
                 existing[key] = outputs[key]
             else:
                 existing[key] = None
@@ -277,7 +281,7 @@ class oncokb_cache(logger):
         if cache_input==None and os.path.exists(cache_output):
             cache_input = cache_output
         cache = self._initialize_cache(cache_input)
-        with open(annotated_cna) as cna_file:
+        with open(annotated_cna, newline='') as cna_file:
             reader = csv.reader(cna_file, delimiter="\t")
             for row in reader:
                 hugo_symbol = row[2]
@@ -301,7 +305,7 @@ class oncokb_cache(logger):
         if cache_input==None and os.path.exists(cache_output):
             cache_input = cache_output
         cache = self._initialize_cache(cache_input)
-        with open(annotated_fusion) as fusion_file:
+        with open(annotated_fusion, newline='') as fusion_file:
             reader = csv.reader(fusion_file, delimiter="\t")
             for row in reader:
                 fusion = row[1]
@@ -1,20 +1,28 @@
 """Simple functions to process actionability tiers and other information from OncoKB"""
 
-import csv
+import functools
 import logging
 import os
 import re
+import numpy as np
+import pandas as pd
 import djerba.core.constants as core_constants
 import djerba.util.oncokb.constants as oncokb
 from djerba.util.environment import directory_finder
 from djerba.util.logger import logger
 
+# matches a comma not followed by whitespace, eg. in OncoKB therapy lists
+COMMA_NO_SPACE = re.compile(r'(?<=[,])(?=[^\s])')
+
 class levels:
 
     ALTERNATE_LEVEL_KEY = 'OncoKB level' #  used in TAR SNV/indel
     ACTIONABLE_LEVELS = ['1', '2', '3A', '3B', '4', 'R1', 'R2', 'P']
     REPORTABLE_LEVELS = ACTIONABLE_LEVELS+['N1', 'N2']
     ALL_LEVELS = ['1', '2', '3A', '3B', '4', 'R1', 'R2', 'N1', 'N2', 'N3', 'N4', 'P', 'Unknown']
+    LEVEL_ORDER = {level: i for i, level in enumerate(ALL_LEVELS)} # see oncokb_order
+    # precomputed (level, column name) pairs; see parse_oncokb_therapies
+    ACTIONABLE_LEVEL_KEYS = [(x, 'LEVEL_'+x) for x in ACTIONABLE_LEVELS]
 
     @staticmethod
     def filter_reportable(rows):
@@ -63,13 +71,10 @@ class levels:
 
     @staticmethod
     def oncokb_order(level):
-        if re.match('Level ', level):
+        # sort order is an O(1) dict lookup; called once per row in sorting
+        if level.startswith('Level '):
             level = level.replace('Level ', '')
-        order = None
-        for i in range(len(levels.ALL_LEVELS)):
-            if str(level) == levels.ALL_LEVELS[i]:
-                order = i
-                break
+        order = levels.LEVEL_ORDER.get(str(level))
         if order == None:
             raise UnrecognizedOncokbLevelError("Unrecognized OncoKB level: {0}".format(level))
         return order
@@ -88,23 +93,57 @@ class levels:
     def parse_actionable_therapies(row_dict):
         return levels.parse_oncokb_therapies(
             row_dict,
-            levels.ACTIONABLE_LEVELS
+            levels.ACTIONABLE_LEVEL_KEYS
         )
 
     @staticmethod
-    def parse_oncokb_therapies(row_dict, levels_list):
-        # find maximum level (if any) from given levels list, and associated therapies
-        # return a dictionary of the form LEVEL->THERAPIES, also record the max level
+    def parse_oncokb_therapies(row_dict, level_keys):
+        # find therapies (if any) for the given (level, column name) pairs
+        # return a dictionary of the form LEVEL->THERAPIES
+        # look up the level keys directly, instead of scanning every column per row;
+        # most rows have no level columns filled, so string work is skipped for them
         therapies = {}
-        # row_dict has keys of the form 'LEVEL_1'; corresponding levels_list entry is '1'
-        for key in row_dict.keys():
-            level = levels.reformat_level_string(key)
-            if level in levels_list and not levels.is_null_string(row_dict[key]):
+        for level, key in level_keys:
+            value = row_dict.get(key)
+            if value is not None and value not in ('', 'NA'):
                 # insert a space between comma and start of next word
-                therapy = re.sub(r'(?<=[,])(?=[^\s])', r' ', row_dict[key])
-                therapies[level] = therapy
+                therapies[level] = COMMA_NO_SPACE.sub(' ', value)
         return therapies
 
+    @staticmethod
+    def parse_level_and_therapies(row_dict):
+        # fused parse_oncokb_level and parse_actionable_therapies;
+        # one traversal of the level columns per row, instead of two.
+        # distinct level-column combinations repeat often across rows,
+        # so the parse itself is memoized on their values
+        values = tuple(row_dict.get(key) for _, key in levels.ACTIONABLE_LEVEL_KEYS)
+        parsed_level, therapies = levels._parse_level_and_therapies_cached(
+            values,
+            row_dict[oncokb.ONCOGENIC_UC]
+        )
+        # return a fresh dict; the cached tuple must stay immutable
+        return parsed_level, dict(therapies)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_level_and_therapies_cached(values, oncogenic):
+        max_key = None
+        therapies = []
+        for (level, key), value in zip(levels.ACTIONABLE_LEVEL_KEYS, values):
+            if value is not None and value not in ('', 'NA'):
+                if max_key is None and level != 'P':
+                    # P is prognostic only; not a therapy level
+                    max_key = key
+                # insert a space between comma and start of next word
+                therapies.append((level, COMMA_NO_SPACE.sub(' ', value)))
+        if max_key:
+            parsed_level = levels.reformat_level_string(max_key)
+        elif not levels.is_null_string(oncogenic):
+            parsed_level = levels.reformat_level_string(oncogenic)
+        else:
+            parsed_level = 'NA'
+        return parsed_level, tuple(therapies)
+
     @staticmethod
     def parse_oncokb_level(row_dict):
         # find oncokb level string: eg. "Level 1", "Likely Oncogenic", "None"
@@ -121,6 +160,30 @@ class levels:
             parsed_level = 'NA'
         return parsed_level
 
+    @staticmethod
+    def parse_oncokb_level_column(data):
+        """
+        Vectorized parse_oncokb_level for a DataFrame of annotated rows
+        Expects string values, as read with dtype=str and keep_default_na=False
+        Stacks the therapy level columns and finds the first non-null entry for
+        all rows in two array passes, instead of a Python scan per row
+        """
+        arr = data[oncokb.ANNOTATION_THERAPY_LEVELS].to_numpy(dtype=object)
+        mask = (arr != '') & (arr != 'NA')
+        has_level = mask.any(axis=1)
+        level_names = np.array(
+            [levels.reformat_level_string(x) for x in oncokb.ANNOTATION_THERAPY_LEVELS]
+        )
+        parsed = level_names[mask.argmax(axis=1)].tolist()
+        # fall back to the oncogenicity column for rows with no therapy level
+        oncogenic = data[oncokb.ONCOGENIC_UC].tolist()
+        for i in np.flatnonzero(~has_level):
+            if levels.is_null_string(oncogenic[i]):
+                parsed[i] = 'NA'
+            else:
+                parsed[i] = levels.reformat_level_string(oncogenic[i])
+        return parsed
+
     @staticmethod
     def reformat_level_string(level):
         unknown = 'Unknown'
@@ -135,7 +198,7 @@ class levels:
         elif level == unknown:
             reformatted = unknown
         else:
-            reformatted = re.sub('LEVEL_', '', level)
+            reformatted = level.replace('LEVEL_', '') # literal, no regex needed
         return reformatted
 
     @staticmethod
@@ -155,11 +218,16 @@ class gene_summary_reader(logger):
     DEFAULT = 'OncoKB summary not available'
 
     def __init__(self, log_level=logging.WARNING, log_path=None):
-        self.summaries = {}
         data_dir = directory_finder(log_level, log_path).get_data_dir()
-        with open(os.path.join(data_dir, oncokb.ALL_CURATED_GENES)) as in_file:
-            for row in csv.DictReader(in_file, delimiter="\t"):
-                self.summaries[row['hugoSymbol']] = row['summary']
+        # read the two wanted columns and build the dict in one C-level pass
+        curated = pd.read_csv(
+            os.path.join(data_dir, oncokb.ALL_CURATED_GENES),
+            sep="\t",
+            usecols=['hugoSymbol', 'summary'],
+            dtype=str,
+            keep_default_na=False
+        )
+        self.summaries = dict(zip(curated['hugoSymbol'], curated['summary']))
 
     def get(self, gene):
         return self.summaries.get(gene, self.DEFAULT)
@@ -1,6 +1,7 @@
 """Class to read and parse the file provenance report (FPR)"""
 
 import csv
+import functools
 import gzip
 import logging
 import re
@@ -9,6 +10,12 @@ import djerba.util.provenance_index as index
 import djerba.util.ini_fields as ini
 from djerba.util.logger import logger
 
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern):
+    # the same metatype/path patterns recur across parse_* calls; compiling
+    # once avoids the per-row re-module cache lookup inside the filters
+    return re.compile(pattern)
+
 class provenance_reader(logger):
 
     # internal dictionary keys
@@ -103,7 +110,7 @@ class provenance_reader(logger):
             raise RuntimeError(msg)
         self.provenance = []
         # find provenance rows with the required project, root sample, and (if given) sample names
-        with gzip.open(provenance_path, 'rt') as infile:
+        with gzip.open(provenance_path, 'rt', newline='') as infile:
             reader = csv.reader(infile, delimiter="\t")
             for row in reader:
                 if row[index.STUDY_TITLE] == project and \
@@ -196,11 +203,13 @@ class provenance_reader(logger):
 
     def _filter_metatype(self, pattern, rows=None):
         if rows == None: rows = self.provenance
-        return filter(lambda x: re.search(pattern, x[index.FILE_META_TYPE]), rows)
+        regex = _compile_pattern(pattern)
+        return filter(lambda x: regex.search(x[index.FILE_META_TYPE]), rows)
 
     def _filter_file_path(self, pattern, rows=None):
         if rows == None: rows = self.provenance
-        return filter(lambda x: re.search(pattern, x[index.FILE_PATH]), rows)
+        regex = _compile_pattern(pattern)
+        return filter(lambda x: regex.search(x[index.FILE_PATH]), rows)
 
     def _filter_sample_name(self, sample_name, rows=None):
         return self._filter_rows(index.SAMPLE_NAME, sample_name, rows)
@@ -279,7 +288,7 @@ class provenance_reader(logger):
             msg = "Cannot initialize file provenance reader: No value found for metadata field '{0}'".format(self.GEO_EXTERNAL_NAME)
             self.logger.error(msg)
             raise RuntimeError(msg)
-        return re.split(',', patient_id_raw).pop(0)
+        return patient_id_raw.split(',', 1)[0]
 
     def _id_tumour(self):
         self.logger.debug("Finding tumour ID")
@@ -355,8 +364,9 @@ class provenance_reader(logger):
         """
         attrs = {}
         attrs[self.SAMPLE_NAME_KEY] = row[0]
-        for entry in re.split(';', row[1]):
-            pair = re.split('=', entry)
+        # literal separators; str.split avoids the regex machinery per row
+        for entry in row[1].split(';'):
+            pair = entry.split('=')
             if len(pair)!=2:
                 msg = "Expected attribute of the form KEY=VALUE, found '{0}'".format(entry)
                 self.logger.error(msg)
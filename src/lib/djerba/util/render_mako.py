@@ -1,11 +1,22 @@
 
+import functools
 import logging
 import traceback
 from mako.lookup import TemplateLookup
 from djerba.util.logger import logger
 
+@functools.lru_cache(maxsize=None)
+def get_renderer(template_dir, log_level=logging.INFO, log_path=None):
+    """Shared renderer per template directory; render() methods which only
+    need their module dir can reuse one instance instead of reconstructing"""
+    return mako_renderer(template_dir, log_level, log_path)
+
 class mako_renderer(logger):
 
+    # compiled templates cached at class level by directory and filename, so
+    # repeated render calls (eg. batch reports) do not recompile the template
+    _template_cache = {}
+
     def __init__(self, template_dir, log_level=logging.INFO, log_path=None):
         self.log_level = log_level
         self.log_path = log_path
@@ -15,8 +26,13 @@ class mako_renderer(logger):
     def get_template(self, template_dir, filename):
         # strict_undefined=True provides an informative error for missing variables in JSON
         # see https://docs.makotemplates.org/en/latest/runtime.html#context-variables
-        report_lookup = TemplateLookup(directories=[template_dir, ], strict_undefined=True)
-        return report_lookup.get_template(filename)
+        key = (template_dir, filename)
+        template = self._template_cache.get(key)
+        if template is None:
+            report_lookup = TemplateLookup(directories=[template_dir, ], strict_undefined=True)
+            template = report_lookup.get_template(filename)
+            self._template_cache[key] = template
+        return template
 
     def render_template(self, mako_template, args):
         try:
@@ -34,25 +34,26 @@ class subprocess_runner(logger):
             capture_output=True,
             encoding=constants.TEXT_ENCODING,
         )
-        stdout = str(result.stdout)
-        stderr = str(result.stderr)
-        if len(stdout) > 10000 and truncate:
-            self.logger.debug('Truncating STDOUT to first 10000 characters; '+\
-                              'set truncate=False for full output')
-            stdout = stdout[0:10000]+' (additional characters truncated)'
-        if len(stderr) > 10000 and truncate:
-            self.logger.debug('Truncating STDERR to first 10000 characters; '+\
-                              'set truncate=False for full output')
-            stderr = stderr[0:10000]+' (additional characters truncated)'
         try:
             result.check_returncode()
         except subprocess.CalledProcessError as err:
             self.logger.error("Failed to run {0}: {1}".format(description, err))
-            self.logger.error("{0} STDOUT: '{1}'".format(description, stdout))
-            self.logger.error("{0} STDERR: '{1}'".format(description, stderr))
+            self.logger.error("{0} STDOUT: '{1}'".format(description, self._truncated(result.stdout, 'STDOUT', truncate)))
+            self.logger.error("{0} STDERR: '{1}'".format(description, self._truncated(result.stderr, 'STDERR', truncate)))
             if raise_err:
                 raise
         self.logger.info("Successfully ran {0}".format(description))
-        self.logger.debug("{0} STDOUT: '{1}'".format(description, stdout))
-        self.logger.debug("{0} STDERR: '{1}'".format(description, stderr))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # only truncate and format the output strings if they will be logged;
+            # R scripts can emit megabytes of chatter on the success path
+            self.logger.debug("{0} STDOUT: '{1}'".format(description, self._truncated(result.stdout, 'STDOUT', truncate)))
+            self.logger.debug("{0} STDERR: '{1}'".format(description, self._truncated(result.stderr, 'STDERR', truncate)))
         return result
+
+    def _truncated(self, output, name, truncate):
+        output = str(output)
+        if len(output) > 10000 and truncate:
+            self.logger.debug('Truncating {0} to first 10000 characters; '.format(name)+\
+                              'set truncate=False for full output')
+            output = output[0:10000]+' (additional characters truncated)'
+        return output
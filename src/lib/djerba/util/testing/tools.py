@@ -2,16 +2,28 @@
 Test base class
 """
 
+import functools
 import gzip
 import hashlib
+import os
 import re
 import tempfile
 import time
 import unittest
+from configparser import ConfigParser
 import djerba.util.constants as constants
 from djerba.util.validator import path_validator
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_ini(ini_path, mtime):
+    # parsed INI cache, keyed by path and mtime; test classes often
+    # re-read the same config file for every test method
+    config = ConfigParser()
+    config.read(ini_path)
+    return config
+
+
 class TestBase(unittest.TestCase):
 
     def setUp(self):
@@ -29,20 +41,35 @@ class TestBase(unittest.TestCase):
 
     def getMD5(self, inputPath):
         with open(inputPath, 'r') as f:
-            md5sum = self.getMD5_of_string(f.read())
-        return md5sum
+            return self._stream_text_md5(f)
 
     def getMD5_of_gzip_path(self, inputPath):
         # gzip compression is not deterministic -- need to uncompress first
-        md5 = hashlib.md5()
         with gzip.open(inputPath, 'rt') as f:
-            return self.getMD5_of_string(f.read())
+            return self._stream_text_md5(f)
+
+    def _stream_text_md5(self, f):
+        # read in text mode so universal-newline translation applies; the
+        # digest must match getMD5_of_string on the whole decoded file, and
+        # csv.writer outputs contain CRLF line endings. Fixed-size chunks
+        # keep peak memory bounded
+        md5 = hashlib.md5()
+        for chunk in iter(lambda: f.read(1048576), ''):
+            md5.update(chunk.encode(constants.TEXT_ENCODING))
+        return md5.hexdigest()
 
     def getMD5_of_string(self, input_string):
         md5 = hashlib.md5()
         md5.update(input_string.encode(constants.TEXT_ENCODING))
         return md5.hexdigest()
 
+    def load_ini(self, ini_path):
+        # return a fresh copy, so per-test mutations do not touch the cache
+        cached = _parse_ini(ini_path, os.path.getmtime(ini_path))
+        config = ConfigParser()
+        config.read_dict(cached)
+        return config
+
     def get_tmp_dir(self):
         # convenience method; returns path to the temp dir
         return self.tmp_dir